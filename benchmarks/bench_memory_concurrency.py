@@ -0,0 +1,133 @@
+"""
+Benchmark MemoryDB read throughput under a concurrent write load
+
+Readers page through the registry and fetch server details while a seed
+import and a stream of publishes run at the same time. Reports read
+throughput and read latency percentiles.
+
+Usage:
+    python benchmarks/bench_memory_concurrency.py [--servers N] [--readers N] [--seconds S]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import tempfile
+import time
+import uuid
+from typing import List
+
+from mcp_registry.database import MemoryDB
+from mcp_registry.models import ServerDetail
+
+
+def make_server(index: int, version: str = "0.0.1") -> dict:
+    """Build a synthetic seed entry"""
+    return {
+        "id": str(uuid.uuid4()),
+        "name": f"io.github.bench/server-{index}",
+        "description": f"Benchmark server {index}",
+        "repository": {
+            "url": f"https://github.com/bench/server-{index}",
+            "source": "github",
+            "id": str(index),
+        },
+        "version_detail": {
+            "version": version,
+            "release_date": "2025-01-01T00:00:00Z",
+            "is_latest": True,
+        },
+        "packages": [
+            {
+                "registry_name": "npm",
+                "name": f"@bench/server-{index}",
+                "version": version,
+                "environment_variables": [{"name": "API_KEY", "description": "key"}],
+            }
+        ],
+    }
+
+
+async def reader(db: MemoryDB, ids: List[str], stop: asyncio.Event, latencies: List[float]) -> None:
+    """Alternate list pages and detail lookups until stopped"""
+    cursor = None
+    while not stop.is_set():
+        started = time.perf_counter()
+        # Yield like a request waiting for its turn on the event loop
+        await asyncio.sleep(0)
+        _, cursor = await db.list(cursor=cursor, limit=30)
+        await db.get_by_id(random.choice(ids))
+        latencies.append(time.perf_counter() - started)
+
+
+async def publisher(db: MemoryDB, stop: asyncio.Event, counter: List[int]) -> None:
+    """Publish new versions of a single server until stopped"""
+    patch = 0
+    while not stop.is_set():
+        patch += 1
+        server = ServerDetail.model_validate(make_server(0, version=f"1.0.{patch}"))
+        await db.publish(server)
+        counter[0] += 1
+        await asyncio.sleep(0)
+
+
+async def run(servers: int, readers: int, seconds: float) -> None:
+    db = MemoryDB()
+    initial = [make_server(i) for i in range(servers)]
+    initial_path = _write_seed(initial)
+    await db.import_seed(initial_path)
+    os.unlink(initial_path)
+    ids = [item["id"] for item in initial]
+
+    # A second seed, imported while the readers run
+    seed_path = _write_seed([make_server(servers + i) for i in range(servers)])
+
+    stop = asyncio.Event()
+    latencies: List[float] = []
+    published = [0]
+    tasks = [asyncio.create_task(reader(db, ids, stop, latencies)) for _ in range(readers)]
+    tasks.append(asyncio.create_task(publisher(db, stop, published)))
+
+    started = time.perf_counter()
+    import_task = asyncio.create_task(db.import_seed(seed_path))
+    await asyncio.sleep(seconds)
+    stop.set()
+    await asyncio.gather(*tasks)
+    import_done = import_task.done()
+    await import_task
+    elapsed = time.perf_counter() - started
+
+    os.unlink(seed_path)
+
+    latencies.sort()
+    print(f"servers: {len(db.entries)}  readers: {readers}  duration: {elapsed:.2f}s")
+    print(f"seed import finished within window: {import_done}")
+    print(f"publishes: {published[0]} ({published[0] / elapsed:.0f}/s)")
+    print(f"reads: {len(latencies)} ({len(latencies) / elapsed:.0f}/s)")
+    if latencies:
+        print(f"read latency p50: {statistics.median(latencies) * 1000:.3f} ms")
+        print(f"read latency p99: {latencies[int(len(latencies) * 0.99)] * 1000:.3f} ms")
+        print(f"read latency max: {latencies[-1] * 1000:.3f} ms")
+
+
+def _write_seed(items: List[dict]) -> str:
+    """Write seed items to a temporary file and return its path"""
+    with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as f:
+        json.dump(items, f)
+        return f.name
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--servers", type=int, default=20000)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    args = parser.parse_args()
+    asyncio.run(run(args.servers, args.readers, args.seconds))
+
+
+if __name__ == "__main__":
+    main()
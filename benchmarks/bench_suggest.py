@@ -0,0 +1,67 @@
+"""
+Benchmark MemoryDB name prefix completion
+
+Fills the prefix index with synthetic reverse-DNS names and times
+suggest() for prefixes of increasing length. Reports latency
+percentiles per prefix length.
+
+Usage:
+    python benchmarks/bench_suggest.py [--names N] [--queries N] [--limit N]
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from typing import List
+
+from mcp_registry.database import MemoryDB
+from mcp_registry.database.memory import _VersionChain
+
+
+def make_names(count: int) -> List[str]:
+    """Build distinct reverse-DNS server names"""
+    owners = [f"owner{i}" for i in range(max(count // 20, 1))]
+    return [f"io.github.{random.choice(owners)}/server-{i}" for i in range(count)]
+
+
+async def run(names: int, queries: int, limit: int) -> None:
+    db = MemoryDB()
+
+    # Fill the name index directly; building a million records would
+    # measure the model layer rather than the lookup
+    started = time.perf_counter()
+    all_names = make_names(names)
+    for i, name in enumerate(all_names):
+        chain = db._versions[name] = _VersionChain()
+        chain.add("1.0.0", str(i))
+    db._names.add_many(all_names)
+    print(f"names: {len(db._names.names)}  indexed in {time.perf_counter() - started:.2f}s")
+
+    for length in (3, 10, 16, 22):
+        latencies = []
+        for _ in range(queries):
+            prefix = random.choice(all_names)[:length]
+            query_started = time.perf_counter()
+            await db.suggest(prefix, limit)
+            latencies.append(time.perf_counter() - query_started)
+        latencies.sort()
+        print(
+            f"prefix length {length:2d}: "
+            f"p50 {statistics.median(latencies) * 1e6:.1f} us  "
+            f"p99 {latencies[int(len(latencies) * 0.99)] * 1e6:.1f} us"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--names", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=10000)
+    parser.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(run(args.names, args.queries, args.limit))
+
+
+if __name__ == "__main__":
+    main()
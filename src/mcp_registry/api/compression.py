@@ -0,0 +1,146 @@
+import asyncio
+import gzip
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+
+from fastapi import Request, Response
+
+try:
+    import brotli
+except ImportError:  # optional: pip install mcp-registry[compression]
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # optional: pip install mcp-registry[compression]
+    zstandard = None
+
+
+# Available content codings in server preference order. Bodies are
+# compressed once per change, so the levels favor size over speed.
+COMPRESSORS: Dict[str, Callable[[bytes], bytes]] = {}
+if zstandard is not None:
+    COMPRESSORS["zstd"] = lambda data: zstandard.ZstdCompressor(level=12).compress(data)
+if brotli is not None:
+    COMPRESSORS["br"] = lambda data: brotli.compress(data, quality=9)
+COMPRESSORS["gzip"] = lambda data: gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def negotiate(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    Pick a content coding for an Accept-Encoding header
+
+    Returns:
+        The acceptable coding with the highest q-value, ties going to the
+        server's preference, or None for the identity coding
+    """
+    if not accept_encoding:
+        return None
+
+    weights: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[coding.strip().lower()] = q
+
+    best, best_q = None, 0.0
+    for coding in COMPRESSORS:
+        q = weights.get(coding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+def variant_etag(etag: str, encoding: Optional[str]) -> str:
+    """Get the strong ETag of a content-coded variant of a representation"""
+    return f'{etag[:-1]}-{encoding}"' if encoding else etag
+
+
+class CompressedBodyCache:
+    """
+    LRU cache of compressed response bodies
+
+    Entries are keyed by the strong ETag of the compressed variant. Detail
+    ETags change only for the records a publish rewrites, but list ETags
+    include the generation, so every publish changes the keys of all list
+    pages. Superseded entries are never hit again and age out of the cache.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Get a cached body, marking it recently used"""
+        body = self._entries.get(key)
+        if body is not None:
+            self._entries.move_to_end(key)
+        return body
+
+    def put(self, key: str, body: bytes) -> None:
+        """Cache a body, evicting the least recently used ones beyond max_bytes"""
+        if len(body) > self.max_bytes:
+            return
+
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self.size -= len(previous)
+        self._entries[key] = body
+        self.size += len(body)
+
+        while self.size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.size -= len(evicted)
+
+    def clear(self) -> None:
+        """Drop all cached bodies"""
+        self._entries.clear()
+        self.size = 0
+
+
+def negotiate_etag(
+    request: Request, etag: str, cache: Optional[CompressedBodyCache]
+) -> Tuple[Optional[str], str]:
+    """
+    Pick the content coding for a request and the ETag of that variant
+
+    Responses are only compressed when a body cache is configured.
+
+    Returns:
+        Tuple of (coding or None, variant ETag)
+    """
+    encoding = negotiate(request.headers.get("accept-encoding")) if cache is not None else None
+    return encoding, variant_etag(etag, encoding)
+
+
+async def encoded_response(
+    content: bytes,
+    encoding: Optional[str],
+    headers: Dict[str, str],
+    cache: Optional[CompressedBodyCache],
+) -> Response:
+    """
+    Build a JSON response in the given content coding
+
+    headers must carry the variant ETag from negotiate_etag(), which keys
+    the compressed body in the cache.
+    """
+    if encoding is None or cache is None:
+        return Response(content=content, media_type="application/json", headers=headers)
+
+    headers = dict(headers)
+    key = headers["ETag"]
+    body = cache.get(key)
+    if body is None:
+        body = await asyncio.to_thread(COMPRESSORS[encoding], content)
+        cache.put(key, body)
+
+    headers["Content-Encoding"] = encoding
+    return Response(content=body, media_type="application/json", headers=headers)
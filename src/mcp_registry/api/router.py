@@ -1,6 +1,6 @@
 from fastapi import APIRouter
 
-from .v0 import health_router, servers_router, publish_router
+from .v0 import health_router, servers_router, publish_router, changes_router
 
 # Main API router
 router = APIRouter()
@@ -8,4 +8,5 @@ router = APIRouter()
 # Include all v0 routers
 router.include_router(health_router)
 router.include_router(servers_router)
-router.include_router(publish_router)
\ No newline at end of file
+router.include_router(publish_router)
+router.include_router(changes_router)
\ No newline at end of file
@@ -1,5 +1,6 @@
 from .health import health_router
 from .servers import servers_router
 from .publish import publish_router
+from .changes import changes_router
 
-__all__ = ["health_router", "servers_router", "publish_router"]
\ No newline at end of file
+__all__ = ["health_router", "servers_router", "publish_router", "changes_router"]
\ No newline at end of file
@@ -0,0 +1,60 @@
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import BaseModel
+
+from ...database.base import ChangesExpiredError
+from ...models import ServerDetail
+from ...service import RegistryService
+
+
+class Change(BaseModel):
+    """A server record as written at a change sequence number"""
+    seq: int
+    server: ServerDetail
+
+
+class ChangesResponse(BaseModel):
+    """Changes after a sequence number, in order"""
+    changes: List[Change]
+    next_since: int
+    has_more: bool
+
+
+changes_router = APIRouter(prefix="/v0", tags=["changes"])
+
+
+def get_registry_service() -> RegistryService:
+    """Dependency to get registry service"""
+    from ...main import app_state
+    return app_state["registry_service"]
+
+
+@changes_router.get("/changes", response_model=ChangesResponse)
+async def list_changes(
+    since: int = Query(..., ge=0, description="Sequence number of the last change already applied"),
+    limit: int = Query(100, ge=1, le=1000, description="Number of changes to return"),
+    registry: RegistryService = Depends(get_registry_service),
+):
+    """
+    Get the server records written after a sequence number
+
+    Pass next_since back as since to resume. A mirror starts from a full
+    export and follows changes from the X-Change-Seq header of that export.
+    """
+
+    try:
+        changes, next_since, has_more = await registry.changes(since, limit)
+    except ChangesExpiredError:
+        raise HTTPException(
+            status_code=410,
+            detail=f"Changes after {since} are no longer available, re-sync from /v0/servers/export",
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    return ChangesResponse(
+        changes=[Change(seq=seq, server=server) for seq, server in changes],
+        next_since=next_since,
+        has_more=has_more,
+    )
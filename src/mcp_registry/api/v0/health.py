@@ -1,13 +1,18 @@
+from typing import Dict, Optional
+
 from fastapi import APIRouter
 from pydantic import BaseModel
 
 from ...config import get_settings
+from ...database import CachingDatabase
 
 
 class HealthResponse(BaseModel):
     """Health check response"""
     status: str
     auth_enabled: bool
+    seed_import: Optional[str] = None
+    cache: Optional[Dict[str, Dict[str, int]]] = None
 
 
 health_router = APIRouter(prefix="/v0", tags=["health"])
@@ -16,8 +21,12 @@ health_router = APIRouter(prefix="/v0", tags=["health"])
 @health_router.get("/health", response_model=HealthResponse)
 async def health_check():
     """Health check endpoint"""
+    from ...main import app_state
     settings = get_settings()
+    database = app_state.get("database")
     return HealthResponse(
         status="ok",
         auth_enabled=settings.auth_enabled,
+        seed_import=app_state.get("seed_import"),
+        cache=database.stats() if isinstance(database, CachingDatabase) else None,
     )
\ No newline at end of file
@@ -1,7 +1,8 @@
-from typing import Optional
+import asyncio
+from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Header
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from ...auth import AuthService
 from ...database.base import AlreadyExistsError, InvalidVersionError, InvalidInputError
@@ -15,6 +16,29 @@ class PublishResponse(BaseModel):
     id: str
 
 
+# Maximum number of servers in one bulk publish request
+MAX_BULK_PUBLISH = 100
+
+
+class BulkPublishRequest(BaseModel):
+    """Servers to publish together"""
+    servers: List[PublishRequest] = Field(..., min_length=1, max_length=MAX_BULK_PUBLISH)
+
+
+class BulkPublishResult(BaseModel):
+    """Outcome of one server in a bulk publish"""
+    name: str
+    version: str
+    status_code: int
+    id: Optional[str] = None
+    error: Optional[str] = None
+
+
+class BulkPublishResponse(BaseModel):
+    """Per-server outcomes of a bulk publish, in request order"""
+    results: List[BulkPublishResult]
+
+
 publish_router = APIRouter(prefix="/v0", tags=["publish"])
 
 
@@ -30,6 +54,46 @@ def get_auth_service() -> AuthService:
     return app_state["auth_service"]
 
 
+def bearer_token(authorization: Optional[str]) -> str:
+    """Extract the token from an Authorization header"""
+    if not authorization:
+        raise HTTPException(status_code=401, detail="Authorization header is required")
+    
+    # Extract token from Bearer format
+    token = authorization
+    if authorization.upper().startswith("BEARER "):
+        token = authorization[7:]
+    return token
+
+
+def auth_info_for(name: str, token: str) -> Authentication:
+    """Build the authentication info for publishing a server name"""
+    
+    # Determine authentication method based on server name prefix
+    auth_method = AuthMethod.NONE
+    if name.startswith("io.github"):
+        auth_method = AuthMethod.GITHUB
+    
+    return Authentication(
+        method=auth_method,
+        token=token,
+        repo_ref=name,
+    )
+
+
+def to_server_detail(publish_request: PublishRequest) -> ServerDetail:
+    """Convert a PublishRequest to a ServerDetail"""
+    return ServerDetail(
+        id=publish_request.id,
+        name=publish_request.name,
+        description=publish_request.description,
+        repository=publish_request.repository,
+        version_detail=publish_request.version_detail,
+        packages=publish_request.packages,
+        remotes=publish_request.remotes,
+    )
+
+
 @publish_router.post("/publish", response_model=PublishResponse, status_code=201)
 async def publish_server(
     publish_request: PublishRequest,
@@ -47,25 +111,8 @@ async def publish_server(
         raise HTTPException(status_code=400, detail="Version is required")
     
     # Handle authentication
-    if not authorization:
-        raise HTTPException(status_code=401, detail="Authorization header is required")
-    
-    # Extract token from Bearer format
-    token = authorization
-    if authorization.upper().startswith("BEARER "):
-        token = authorization[7:]
-    
-    # Determine authentication method based on server name prefix
-    auth_method = AuthMethod.NONE
-    if publish_request.name.startswith("io.github"):
-        auth_method = AuthMethod.GITHUB
-    
-    # Setup authentication info
-    auth_info = Authentication(
-        method=auth_method,
-        token=token,
-        repo_ref=publish_request.name,
-    )
+    token = bearer_token(authorization)
+    auth_info = auth_info_for(publish_request.name, token)
     
     # Validate authentication
     try:
@@ -76,15 +123,7 @@ async def publish_server(
         raise HTTPException(status_code=401, detail=f"Authentication failed: {str(e)}")
     
     # Convert PublishRequest to ServerDetail
-    server_detail = ServerDetail(
-        id=publish_request.id,
-        name=publish_request.name,
-        description=publish_request.description,
-        repository=publish_request.repository,
-        version_detail=publish_request.version_detail,
-        packages=publish_request.packages,
-        remotes=publish_request.remotes,
-    )
+    server_detail = to_server_detail(publish_request)
     
     # Publish the server
     try:
@@ -98,4 +137,78 @@ async def publish_server(
     except (InvalidVersionError, AlreadyExistsError, InvalidInputError) as e:
         raise HTTPException(status_code=400, detail=f"Failed to publish server details: {str(e)}")
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to publish server details: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Failed to publish server details: {str(e)}")
+
+
+@publish_router.post("/publish:batch", response_model=BulkPublishResponse)
+async def publish_servers(
+    bulk_request: BulkPublishRequest,
+    authorization: Optional[str] = Header(None),
+    registry: RegistryService = Depends(get_registry_service),
+    auth_service: AuthService = Depends(get_auth_service),
+):
+    """Publish several servers together, with a result for each one"""
+    
+    token = bearer_token(authorization)
+    requests = bulk_request.servers
+    results: List[Optional[BulkPublishResult]] = [None] * len(requests)
+    
+    # Validate required fields
+    for i, publish_request in enumerate(requests):
+        if not publish_request.name:
+            results[i] = BulkPublishResult(
+                name="", version=publish_request.version_detail.version,
+                status_code=400, error="Name is required",
+            )
+        elif not publish_request.version_detail.version:
+            results[i] = BulkPublishResult(
+                name=publish_request.name, version="",
+                status_code=400, error="Version is required",
+            )
+    
+    # Authenticate each distinct server name once, concurrently
+    names = list(dict.fromkeys(
+        publish_request.name for i, publish_request in enumerate(requests) if results[i] is None
+    ))
+    outcomes = await asyncio.gather(
+        *(auth_service.validate_auth(auth_info_for(name, token)) for name in names),
+        return_exceptions=True,
+    )
+    auth_errors = {}
+    for name, outcome in zip(names, outcomes):
+        if isinstance(outcome, Exception):
+            auth_errors[name] = f"Authentication failed: {str(outcome)}"
+        elif not outcome:
+            auth_errors[name] = "Invalid authentication credentials"
+    
+    for i, publish_request in enumerate(requests):
+        if results[i] is None and publish_request.name in auth_errors:
+            results[i] = BulkPublishResult(
+                name=publish_request.name, version=publish_request.version_detail.version,
+                status_code=401, error=auth_errors[publish_request.name],
+            )
+    
+    # Publish the rest in one group commit
+    pending = [i for i, result in enumerate(results) if result is None]
+    server_details = [to_server_detail(requests[i]) for i in pending]
+    try:
+        errors = await registry.publish_many(server_details) if server_details else []
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to publish server details: {str(e)}")
+    
+    for i, server_detail, error in zip(pending, server_details, errors):
+        result = BulkPublishResult(
+            name=server_detail.name,
+            version=server_detail.version_detail.version,
+            status_code=201,
+            id=server_detail.id,
+        )
+        if error is not None:
+            result.id = None
+            result.status_code = (
+                400 if isinstance(error, (InvalidVersionError, AlreadyExistsError, InvalidInputError)) else 500
+            )
+            result.error = f"Failed to publish server details: {str(error)}"
+        results[i] = result
+    
+    return BulkPublishResponse(results=results)
\ No newline at end of file
@@ -1,11 +1,16 @@
+import json
 import uuid
-from typing import List, Optional
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from pydantic import BaseModel
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
 
+from ..compression import CompressedBodyCache, encoded_response, negotiate_etag
 from ...database import Database
-from ...database.base import NotFoundError
+from ...database.base import InvalidInputError, NotFoundError, content_hash
 from ...models import Server, ServerDetail
 from ...service import RegistryService
 
@@ -23,6 +28,81 @@ class PaginatedResponse(BaseModel):
     metadata: Optional[Metadata] = None
 
 
+class Suggestion(BaseModel):
+    """Server name completion"""
+    name: str
+    id: str
+
+
+class SuggestResponse(BaseModel):
+    """Name completions for a prefix"""
+    suggestions: List[Suggestion]
+
+
+# Maximum number of IDs in one batchGet request
+MAX_BATCH_GET_IDS = 100
+
+
+class BatchGetRequest(BaseModel):
+    """Server IDs to resolve in one request"""
+    ids: List[str] = Field(..., min_length=1, max_length=MAX_BATCH_GET_IDS)
+
+
+class BatchGetResponse(BaseModel):
+    """Servers found for a batchGet request"""
+    servers: List[ServerDetail]
+    not_found: List[str]
+
+
+def encode_page(servers: List[bytes], metadata: Optional[Metadata]) -> bytes:
+    """Build a PaginatedResponse body from pre-encoded Server summaries"""
+    encoded_metadata = metadata.model_dump_json().encode() if metadata else b"null"
+    return b'{"servers":[' + b",".join(servers) + b'],"metadata":' + encoded_metadata + b"}"
+
+
+def cache_headers(etag: Optional[str], last_modified: Optional[datetime]) -> Dict[str, str]:
+    """Build the validator headers of a response"""
+    headers = {"Vary": "Accept-Encoding"}
+    if last_modified:
+        headers["Last-Modified"] = format_datetime(
+            last_modified.astimezone(timezone.utc), usegmt=True
+        )
+    if etag:
+        headers["ETag"] = etag
+    return headers
+
+
+def not_modified(
+    request: Request, etag: Optional[str], last_modified: Optional[datetime]
+) -> bool:
+    """
+    Check whether the client's cached copy is current
+
+    If-None-Match takes precedence over If-Modified-Since, which is only
+    checked when no If-None-Match header is sent.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if etag is None:
+            return False
+        if if_none_match.strip() == "*":
+            return True
+        return etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        # HTTP dates have a resolution of one second
+        return last_modified.replace(microsecond=0) <= since
+
+    return False
+
+
 servers_router = APIRouter(prefix="/v0", tags=["servers"])
 
 
@@ -32,13 +112,26 @@ def get_registry_service() -> RegistryService:
     return app_state["registry_service"]
 
 
+def get_body_cache() -> Optional[CompressedBodyCache]:
+    """Dependency to get the compressed body cache (None when compression is off)"""
+    from ...main import app_state
+    return app_state.get("body_cache")
+
+
 @servers_router.get("/servers", response_model=PaginatedResponse)
 async def list_servers(
+    request: Request,
     cursor: Optional[str] = Query(None, description="Pagination cursor"),
     limit: int = Query(30, ge=1, le=100, description="Number of servers to return"),
+    name: Optional[str] = Query(None, description="Exact server name"),
+    repo_url: Optional[str] = Query(None, description="Repository URL"),
+    registry_name: Optional[str] = Query(None, description="Package registry, e.g. npm"),
+    package_name: Optional[str] = Query(None, description="Package name"),
+    transport_type: Optional[str] = Query(None, description="Remote transport type, e.g. sse"),
     registry: RegistryService = Depends(get_registry_service),
+    body_cache: Optional[CompressedBodyCache] = Depends(get_body_cache),
 ):
-    """List servers with pagination"""
+    """List servers with pagination and optional filters"""
     
     # Validate cursor format if provided
     if cursor:
@@ -47,29 +140,152 @@ async def list_servers(
         except ValueError:
             raise HTTPException(status_code=400, detail="Invalid cursor parameter")
     
+    # Database filter keys of the given query parameters
+    filters = {
+        key: value
+        for key, value in (
+            ("name", name),
+            ("repoUrl", repo_url),
+            ("registryName", registry_name),
+            ("packageName", package_name),
+            ("transportType", transport_type),
+        )
+        if value is not None
+    }
+    
     try:
-        servers, next_cursor = await registry.list(cursor=cursor, limit=limit)
+        # A page only changes when the generation does, so the generation and
+        # the query identify its content
+        generation, last_modified = await registry.generation()
+        query = str(sorted(request.query_params.multi_items())).encode()
+        encoding, etag = negotiate_etag(
+            request, f'"{generation}-{content_hash(query)}"', body_cache
+        )
+        headers = cache_headers(etag, last_modified)
+        if not_modified(request, etag, last_modified):
+            return Response(status_code=304, headers=headers)
         
-        # Create response
-        response = PaginatedResponse(servers=servers)
+        servers, next_cursor = await registry.list_json(
+            cursor=cursor, limit=limit, filters=filters or None
+        )
         
-        # Add metadata if there's a next cursor
-        if next_cursor:
-            response.metadata = Metadata(
-                next_cursor=next_cursor,
-                count=len(servers),
-            )
+        # Totals are maintained by the backend, so they are cheap to include
+        metadata = Metadata(
+            next_cursor=next_cursor,
+            count=len(servers),
+            total=await registry.count(filters or None),
+        )
         
-        return response
+        return await encoded_response(
+            encode_page(servers, metadata), encoding, headers, body_cache
+        )
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@servers_router.get("/servers/export")
+async def export_servers(
+    registry: RegistryService = Depends(get_registry_service),
+):
+    """
+    Stream the latest version of every server as NDJSON, one ServerDetail per line
+
+    The X-Change-Seq header is the sequence number to follow /v0/changes
+    from to keep the exported copy up to date.
+    """
+    try:
+        seq = await registry.change_seq()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    return StreamingResponse(
+        registry.export_json(),
+        media_type="application/x-ndjson",
+        headers={"X-Change-Seq": str(seq)},
+    )
+
+
+@servers_router.get("/servers/search", response_model=PaginatedResponse)
+async def search_servers(
+    q: str = Query(..., min_length=1, max_length=200, description="Search terms"),
+    cursor: Optional[str] = Query(None, description="Pagination cursor"),
+    limit: int = Query(30, ge=1, le=100, description="Number of servers to return"),
+    registry: RegistryService = Depends(get_registry_service),
+):
+    """Search servers by name, description and package names, best matches first"""
+    
+    try:
+        servers, next_cursor = await registry.search_json(q, cursor=cursor, limit=limit)
+    except InvalidInputError:
+        raise HTTPException(status_code=400, detail="Invalid cursor parameter")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    
+    metadata = Metadata(next_cursor=next_cursor, count=len(servers))
+    return Response(
+        content=encode_page(servers, metadata),
+        media_type="application/json",
+    )
+
+
+@servers_router.get("/servers/suggest", response_model=SuggestResponse)
+async def suggest_servers(
+    prefix: str = Query(..., min_length=1, max_length=200, description="Start of the server name"),
+    limit: int = Query(10, ge=1, le=20, description="Number of names to return"),
+    registry: RegistryService = Depends(get_registry_service),
+):
+    """Complete a server name prefix, for type-ahead"""
+    
+    try:
+        suggestions = await registry.suggest(prefix, limit=limit)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    
+    return SuggestResponse(
+        suggestions=[Suggestion(name=name, id=id) for name, id in suggestions]
+    )
+
+
+@servers_router.post("/servers:batchGet", response_model=BatchGetResponse)
+async def batch_get_servers(
+    request: BatchGetRequest,
+    registry: RegistryService = Depends(get_registry_service),
+):
+    """Get detailed information about several servers in one request"""
+    
+    # Repeated IDs are resolved once; malformed IDs can't exist and are
+    # reported as not found
+    ids = list(dict.fromkeys(request.ids))
+    valid_ids = []
+    for server_id in ids:
+        try:
+            uuid.UUID(server_id)
+        except ValueError:
+            continue
+        valid_ids.append(server_id)
+    
+    try:
+        found = await registry.get_many_json(valid_ids) if valid_ids else {}
+    except Exception:
+        raise HTTPException(status_code=500, detail="Error retrieving server details")
+    
+    # Servers in request order, plus the IDs that were not found
+    servers = [found[server_id] for server_id in ids if server_id in found]
+    not_found = [server_id for server_id in ids if server_id not in found]
+    content = (
+        b'{"servers":[' + b",".join(servers) + b'],"not_found":'
+        + json.dumps(not_found).encode() + b"}"
+    )
+    return Response(content=content, media_type="application/json")
+
+
 @servers_router.get("/servers/{server_id}", response_model=ServerDetail)
 async def get_server_detail(
+    request: Request,
     server_id: str,
     registry: RegistryService = Depends(get_registry_service),
+    body_cache: Optional[CompressedBodyCache] = Depends(get_body_cache),
 ):
     """Get detailed information about a specific server"""
     
@@ -80,8 +296,23 @@ async def get_server_detail(
         raise HTTPException(status_code=400, detail="Invalid server ID format")
     
     try:
-        server_detail = await registry.get_by_id(server_id)
-        return server_detail
+        # Answer revalidations from the stored ETag, without encoding the record.
+        # The generation is only read for If-Modified-Since, which the ETag
+        # supersedes, so plain fetches take a single read.
+        etag = None
+        last_modified = None
+        if "if-none-match" in request.headers:
+            _, etag = negotiate_etag(request, await registry.etag(server_id), body_cache)
+        elif "if-modified-since" in request.headers:
+            _, last_modified = await registry.generation()
+        if not_modified(request, etag, last_modified):
+            return Response(status_code=304, headers=cache_headers(etag, last_modified))
+        
+        server_detail, etag = await registry.get_json_with_etag(server_id)
+        encoding, etag = negotiate_etag(request, etag, body_cache)
+        return await encoded_response(
+            server_detail, encoding, cache_headers(etag, last_modified), body_cache
+        )
     except NotFoundError:
         raise HTTPException(status_code=404, detail="Server not found")
     except Exception as e:
@@ -22,6 +22,25 @@ class Settings(BaseSettings):
     database_url: str = Field(default="mongodb://localhost:27017")
     database_name: str = Field(default="mcp-registry")
     collection_name: str = Field(default="servers_v2")
+    check_query_plans: bool = Field(default=True)
+    trusted_reads: bool = Field(default=True)
+    count_cache_ttl: float = Field(default=30.0)
+    
+    # Read cache configuration
+    read_cache: bool = Field(default=False)
+    read_cache_ttl: float = Field(default=60.0)
+    read_cache_detail_bytes: int = Field(default=32 * 1024 * 1024)
+    read_cache_list_bytes: int = Field(default=16 * 1024 * 1024)
+    
+    # In-memory database configuration
+    memory_json_cache: bool = Field(default=True)
+    memory_data_dir: Optional[str] = Field(default=None)
+    memory_snapshot_interval: int = Field(default=10000)
+    memory_change_log_size: int = Field(default=100000, ge=1)
+    
+    # Response compression configuration
+    response_compression: bool = Field(default=True)
+    compression_cache_bytes: int = Field(default=64 * 1024 * 1024)
     
     # Logging configuration
     log_level: str = Field(default="info")
@@ -29,6 +48,9 @@ class Settings(BaseSettings):
     # Seed data configuration
     seed_file_path: str = Field(default="data/seed.json")
     seed_import: bool = Field(default=True)
+    seed_batch_size: int = Field(default=500)
+    seed_import_workers: int = Field(default=0)
+    seed_import_background: bool = Field(default=False)
     
     # Application metadata
     version: str = Field(default="dev")
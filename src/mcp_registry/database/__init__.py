@@ -1,6 +1,7 @@
 from .base import Database, DatabaseError, ConnectionType, ConnectionInfo
 from .memory import MemoryDB
 from .mongo import MongoDB
+from .cache import CachingDatabase
 
 __all__ = [
     "Database",
@@ -9,4 +10,5 @@ __all__ = [
     "ConnectionInfo",
     "MemoryDB",
     "MongoDB",
+    "CachingDatabase",
 ]
\ No newline at end of file
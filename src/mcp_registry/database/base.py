@@ -1,6 +1,8 @@
+import hashlib
 from abc import ABC, abstractmethod
+from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple
 from pydantic import BaseModel
 
 from ..models import Server, ServerDetail
@@ -31,6 +33,11 @@ class InvalidVersionError(DatabaseError):
     pass
 
 
+class ChangesExpiredError(DatabaseError):
+    """Requested changes are no longer retained"""
+    pass
+
+
 class ConnectionType(str, Enum):
     """Database connection types"""
     MEMORY = "memory"
@@ -44,6 +51,26 @@ class ConnectionInfo(BaseModel):
     raw: Optional[Any] = None
 
 
+def content_hash(data: bytes) -> str:
+    """Hash encoded content for use in an ETag"""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def filter_values(entry: ServerDetail) -> Set[Tuple[str, str]]:
+    """Get the (list filter key, value) pairs an entry matches"""
+    values = {
+        ("name", entry.name),
+        ("repoUrl", entry.repository.url),
+        ("version", entry.version_detail.version),
+    }
+    for package in entry.packages or []:
+        values.add(("registryName", package.registry_name))
+        values.add(("packageName", package.name))
+    for remote in entry.remotes or []:
+        values.add(("transportType", remote.transport_type))
+    return values
+
+
 class Database(ABC):
     """Abstract base class for database operations"""
 
@@ -67,6 +94,64 @@ class Database(ABC):
         """
         pass
 
+    @abstractmethod
+    async def count(self, filter_params: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Count the servers list() would return across all pages
+        
+        Backends keep these counts up to date on writes rather than
+        scanning on every call.
+        
+        Args:
+            filter_params: Optional filtering parameters
+            
+        Returns:
+            Number of matching servers
+        """
+        pass
+
+    @abstractmethod
+    async def search(
+        self,
+        query: str,
+        cursor: Optional[str] = None,
+        limit: int = 10,
+    ) -> Tuple[List[Server], Optional[str]]:
+        """
+        Search latest server versions by name, description and package names
+        
+        Every term of the query must match. Results are ranked by
+        relevance, so cursors are result offsets rather than IDs.
+        
+        Args:
+            query: Search terms
+            cursor: Optional cursor for pagination
+            limit: Maximum number of results to return
+            
+        Returns:
+            Tuple of (servers, next_cursor)
+            
+        Raises:
+            InvalidInputError: If the cursor is invalid
+        """
+        pass
+
+    @abstractmethod
+    async def suggest(self, prefix: str, limit: int = 10) -> List[Tuple[str, str]]:
+        """
+        Complete a server name prefix
+        
+        Names are matched case-sensitively, as stored.
+        
+        Args:
+            prefix: Start of the server name
+            limit: Maximum number of names to return
+            
+        Returns:
+            List of (name, ID of the latest version), ordered by name
+        """
+        pass
+
     @abstractmethod
     async def get_by_id(self, id: str) -> ServerDetail:
         """
@@ -83,6 +168,207 @@ class Database(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_many(self, ids: List[str]) -> Dict[str, ServerDetail]:
+        """
+        Get several servers by ID in one lookup
+        
+        Args:
+            ids: Server IDs
+            
+        Returns:
+            Found servers by ID; IDs that don't exist are left out
+        """
+        pass
+
+    @abstractmethod
+    async def latest_versions(self, names: List[str]) -> Dict[str, ServerDetail]:
+        """
+        Get the latest version of several servers by name
+        
+        Args:
+            names: Server names
+            
+        Returns:
+            Latest version by name; names that don't exist are left out
+        """
+        pass
+
+    async def list_json(
+        self,
+        filter_params: Optional[Dict[str, Any]] = None,
+        cursor: Optional[str] = None,
+        limit: int = 10,
+    ) -> Tuple[List[bytes], Optional[str]]:
+        """
+        List servers as JSON-encoded Server summaries
+
+        Backends that keep pre-encoded records override this to skip
+        model construction and serialization.
+
+        Args:
+            filter_params: Optional filtering parameters
+            cursor: Optional cursor for pagination
+            limit: Maximum number of results to return
+
+        Returns:
+            Tuple of (encoded servers, next_cursor)
+        """
+        servers, next_cursor = await self.list(filter_params, cursor, limit)
+        return [server.model_dump_json().encode() for server in servers], next_cursor
+
+    async def search_json(
+        self,
+        query: str,
+        cursor: Optional[str] = None,
+        limit: int = 10,
+    ) -> Tuple[List[bytes], Optional[str]]:
+        """
+        Search servers, returning JSON-encoded Server summaries
+
+        Args:
+            query: Search terms
+            cursor: Optional cursor for pagination
+            limit: Maximum number of results to return
+
+        Returns:
+            Tuple of (encoded servers, next_cursor)
+        """
+        servers, next_cursor = await self.search(query, cursor, limit)
+        return [server.model_dump_json().encode() for server in servers], next_cursor
+
+    async def get_json_by_id(self, id: str) -> bytes:
+        """
+        Get the JSON-encoded ServerDetail of a server by its ID
+
+        Args:
+            id: Server ID
+
+        Returns:
+            Encoded ServerDetail
+
+        Raises:
+            NotFoundError: If server not found
+        """
+        server_detail = await self.get_by_id(id)
+        return server_detail.model_dump_json().encode()
+
+    async def get_many_json(self, ids: List[str]) -> Dict[str, bytes]:
+        """
+        Get the JSON-encoded ServerDetails of several servers by ID
+
+        Args:
+            ids: Server IDs
+
+        Returns:
+            Encoded ServerDetails by ID; IDs that don't exist are left out
+        """
+        servers = await self.get_many(ids)
+        return {id: server.model_dump_json().encode() for id, server in servers.items()}
+
+    async def etag(self, id: str) -> str:
+        """
+        Get the strong ETag of a server's detail representation
+
+        Backends that keep per-record content hashes override this so that
+        conditional requests are answered without encoding the record.
+
+        Args:
+            id: Server ID
+
+        Returns:
+            Quoted ETag
+
+        Raises:
+            NotFoundError: If server not found
+        """
+        _, etag = await self.get_json_with_etag(id)
+        return etag
+
+    async def get_json_with_etag(self, id: str) -> Tuple[bytes, str]:
+        """
+        Get the JSON-encoded ServerDetail of a server and its ETag together
+
+        Args:
+            id: Server ID
+
+        Returns:
+            Tuple of (encoded ServerDetail, quoted ETag)
+
+        Raises:
+            NotFoundError: If server not found
+        """
+        data = await self.get_json_by_id(id)
+        return data, f'"{content_hash(data)}"'
+
+    @abstractmethod
+    def export_json(self, batch_size: int = 500) -> AsyncIterator[bytes]:
+        """
+        Stream the latest version of every server as NDJSON
+
+        Records are read batch by batch in ID order, so memory use does not
+        grow with the catalog. Servers published while an export runs may
+        or may not be included, as when paging through list().
+
+        Args:
+            batch_size: Number of records read and yielded at a time
+
+        Returns:
+            Async iterator of chunks of newline-terminated ServerDetail JSON
+        """
+        pass
+
+    @abstractmethod
+    async def changes(
+        self, since: int, limit: int
+    ) -> Tuple[List[Tuple[int, ServerDetail]], int, bool]:
+        """
+        Get the records written after a change sequence number
+
+        Every stored record gets a new sequence number whenever it is
+        written by a publish or a seed import, including versions that are
+        no longer the latest. Applying the changes in order brings a copy
+        of the records up to date.
+
+        Args:
+            since: Sequence number of the last change already applied
+            limit: Maximum number of changes to return
+
+        Returns:
+            Tuple of (list of (sequence number, record) in order, sequence
+            number to resume from, whether more changes follow)
+
+        Raises:
+            ChangesExpiredError: If changes after since are no longer retained
+        """
+        pass
+
+    @abstractmethod
+    async def change_seq(self) -> int:
+        """
+        Get the sequence number to follow changes from
+
+        Every record visible when this is called was written at or before
+        the returned sequence number.
+
+        Returns:
+            Sequence number to pass as since to changes()
+        """
+        pass
+
+    @abstractmethod
+    async def generation(self) -> Tuple[int, datetime]:
+        """
+        Get the registry generation
+
+        The generation increases with every publish and seed import, so an
+        unchanged generation means that no listing has changed.
+
+        Returns:
+            Tuple of (generation, time of the last change)
+        """
+        pass
+
     @abstractmethod
     async def publish(self, server_detail: ServerDetail) -> None:
         """
@@ -98,6 +384,23 @@ class Database(ABC):
         """
         pass
 
+    @abstractmethod
+    async def publish_many(self, servers: List[ServerDetail]) -> List[Optional[DatabaseError]]:
+        """
+        Publish several servers in one group commit
+        
+        Each server is checked as publish() would, against the stored
+        versions and the servers before it in the list. Accepted servers
+        get their ID set and are written together.
+        
+        Args:
+            servers: Server details to publish, in order
+            
+        Returns:
+            None for each published server, or the error that rejected it
+        """
+        pass
+
     @abstractmethod
     async def import_seed(self, seed_file_path: str) -> None:
         """
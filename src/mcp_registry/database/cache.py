@@ -0,0 +1,348 @@
+import itertools
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, Hashable, Iterable, List, Optional, Tuple
+
+from ..models import Server, ServerDetail
+from .base import (
+    Database,
+    DatabaseError,
+    ConnectionInfo,
+)
+
+# Nominal size of a cached count
+COUNT_SIZE = 64
+
+
+class LRUCache:
+    """
+    Byte-bounded LRU cache whose entries also expire after a TTL
+
+    Counts hits, misses and evictions for monitoring.
+    """
+
+    def __init__(self, max_bytes: int, ttl: float):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # key -> (value, size, expiry on the monotonic clock)
+        self._entries: "OrderedDict[Hashable, Tuple[Any, int, float]]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get an unexpired value, marking it recently used"""
+        entry = self._entries.get(key)
+        if entry is not None and entry[2] <= time.monotonic():
+            self.pop(key)
+            entry = None
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key: Hashable, value: Any, size: int) -> None:
+        """Cache a value, evicting the least recently used ones beyond max_bytes"""
+        if size > self.max_bytes:
+            return
+
+        self.pop(key)
+        self._entries[key] = (value, size, time.monotonic() + self.ttl)
+        self.size += size
+
+        while self.size > self.max_bytes:
+            _, (_, evicted_size, _) = self._entries.popitem(last=False)
+            self.size -= evicted_size
+            self.evictions += 1
+
+    def pop(self, key: Hashable) -> None:
+        """Drop a value, if cached"""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= entry[1]
+
+    def keys(self) -> List[Hashable]:
+        """Get a snapshot of the cached keys"""
+        return list(self._entries)
+
+    def clear(self) -> None:
+        """Drop all cached values"""
+        self._entries.clear()
+        self.size = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Get the hit, miss and eviction counts and the current size"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self.size,
+        }
+
+
+def _filter_key(filter_params: Optional[Dict[str, Any]]) -> Tuple[Tuple[str, Any], ...]:
+    """Build a hashable cache key from list filters"""
+    return tuple(sorted((filter_params or {}).items()))
+
+
+class CachingDatabase(Database):
+    """
+    Read-through cache around another Database
+
+    Detail records (with their ETags), list_json() pages and counts are
+    kept in two byte-bounded LRU caches whose entries expire after ttl
+    seconds. Searches, exports and the change feed go straight through.
+
+    Pages and counts are cached per backend generation, the newest one
+    returned by generation(). The API reads it for every list request
+    and uses it in the list ETag, so a page is never served under a
+    generation newer than its content. Pages of older generations are
+    dropped as soon as a newer one is seen, which also covers publishes
+    through other instances sharing a MongoDB database.
+
+    Detail records are invalidated precisely: before writing, the current
+    latest version of each published name is looked up, and afterwards
+    its record is dropped along with the new one. Seed imports drop
+    everything. Records changed through other instances are not seen, so
+    the TTL bounds how stale they can get.
+    """
+
+    def __init__(
+        self,
+        database: Database,
+        detail_bytes: int = 32 * 1024 * 1024,
+        list_bytes: int = 16 * 1024 * 1024,
+        ttl: float = 60.0,
+    ):
+        self.database = database
+        self.details = LRUCache(detail_bytes, ttl)
+        self.pages = LRUCache(list_bytes, ttl)
+        # Bumped by every invalidation; reads that overlap one are not cached
+        self._epoch = 0
+        # Newest backend generation seen, which the cached pages belong to
+        self._generation: Optional[int] = None
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Get the statistics of the detail and list caches"""
+        return {"detail": self.details.stats(), "list": self.pages.stats()}
+
+    async def list(
+        self,
+        filter_params: Optional[Dict[str, Any]] = None,
+        cursor: Optional[str] = None,
+        limit: int = 10,
+    ) -> Tuple[List[Server], Optional[str]]:
+        """List servers (not cached: the API serves list_json())"""
+        return await self.database.list(filter_params, cursor, limit)
+
+    async def list_json(
+        self,
+        filter_params: Optional[Dict[str, Any]] = None,
+        cursor: Optional[str] = None,
+        limit: int = 10,
+    ) -> Tuple[List[bytes], Optional[str]]:
+        """List servers as JSON-encoded Server summaries, cached per page"""
+        epoch = self._epoch
+        key = ("page", await self._page_generation(), _filter_key(filter_params), cursor, limit)
+        page = self.pages.get(key)
+        if page is not None:
+            return page
+
+        page = await self.database.list_json(filter_params, cursor, limit)
+        if epoch == self._epoch:
+            self.pages.put(key, page, sum(len(server) for server in page[0]))
+        return page
+
+    async def count(self, filter_params: Optional[Dict[str, Any]] = None) -> int:
+        """Count the servers list() would return, cached per filter"""
+        epoch = self._epoch
+        key = ("count", await self._page_generation(), _filter_key(filter_params))
+        total = self.pages.get(key)
+        if total is not None:
+            return total
+
+        total = await self.database.count(filter_params)
+        if epoch == self._epoch:
+            self.pages.put(key, total, COUNT_SIZE)
+        return total
+
+    async def search(
+        self,
+        query: str,
+        cursor: Optional[str] = None,
+        limit: int = 10,
+    ) -> Tuple[List[Server], Optional[str]]:
+        """Search latest server versions"""
+        return await self.database.search(query, cursor, limit)
+
+    async def search_json(
+        self,
+        query: str,
+        cursor: Optional[str] = None,
+        limit: int = 10,
+    ) -> Tuple[List[bytes], Optional[str]]:
+        """Search servers, returning JSON-encoded Server summaries"""
+        return await self.database.search_json(query, cursor, limit)
+
+    async def suggest(self, prefix: str, limit: int = 10) -> List[Tuple[str, str]]:
+        """Complete a server name prefix"""
+        return await self.database.suggest(prefix, limit)
+
+    async def get_by_id(self, id: str) -> ServerDetail:
+        """Get a server by its ID, decoded from the cached record"""
+        data, _ = await self.get_json_with_etag(id)
+        return ServerDetail.model_validate_json(data)
+
+    async def get_many(self, ids: List[str]) -> Dict[str, ServerDetail]:
+        """Get several servers by ID, decoded from the cached records"""
+        servers = await self.get_many_json(ids)
+        return {id: ServerDetail.model_validate_json(data) for id, data in servers.items()}
+
+    async def latest_versions(self, names: List[str]) -> Dict[str, ServerDetail]:
+        """Get the latest version of several servers by name"""
+        return await self.database.latest_versions(names)
+
+    async def get_json_by_id(self, id: str) -> bytes:
+        """Get the JSON-encoded ServerDetail of a server by its ID"""
+        data, _ = await self.get_json_with_etag(id)
+        return data
+
+    async def get_many_json(self, ids: List[str]) -> Dict[str, bytes]:
+        """
+        Get the JSON-encoded ServerDetails of several servers by ID
+
+        Cached records are served as-is and the rest are fetched with one
+        lookup. Those are cached without their ETag, which is filled in
+        by the next etag() call.
+        """
+        servers: Dict[str, bytes] = {}
+        missing = []
+        for id in dict.fromkeys(ids):
+            entry = self.details.get(id)
+            if entry is not None:
+                servers[id] = entry[0]
+            else:
+                missing.append(id)
+
+        if missing:
+            epoch = self._epoch
+            found = await self.database.get_many_json(missing)
+            if epoch == self._epoch:
+                for id, data in found.items():
+                    self.details.put(id, (data, None), len(data))
+            servers.update(found)
+
+        return servers
+
+    async def etag(self, id: str) -> str:
+        """Get the ETag of a server's detail representation"""
+        _, etag = await self.get_json_with_etag(id)
+        return etag
+
+    async def get_json_with_etag(self, id: str) -> Tuple[bytes, str]:
+        """Get the JSON-encoded ServerDetail of a server and its ETag, cached per ID"""
+        entry = self.details.get(id)
+        if entry is not None and entry[1] is not None:
+            return entry
+
+        epoch = self._epoch
+        if entry is not None:
+            entry = (entry[0], await self.database.etag(id))
+        else:
+            entry = await self.database.get_json_with_etag(id)
+        if epoch == self._epoch:
+            self.details.put(id, entry, len(entry[0]))
+        return entry
+
+    def export_json(self, batch_size: int = 500) -> AsyncIterator[bytes]:
+        """Stream the latest version of every server as NDJSON"""
+        return self.database.export_json(batch_size)
+
+    async def changes(
+        self, since: int, limit: int
+    ) -> Tuple[List[Tuple[int, ServerDetail]], int, bool]:
+        """Get the records written after a change sequence number"""
+        return await self.database.changes(since, limit)
+
+    async def change_seq(self) -> int:
+        """Get the sequence number to follow changes from"""
+        return await self.database.change_seq()
+
+    async def generation(self) -> Tuple[int, datetime]:
+        """Get the registry generation, dropping the pages of older ones"""
+        generation, modified = await self.database.generation()
+        self._see_generation(generation)
+        return generation, modified
+
+    async def _page_generation(self) -> int:
+        """Get the generation to cache pages under, reading it if none was seen yet"""
+        if self._generation is None:
+            await self.generation()
+        return self._generation
+
+    def _see_generation(self, generation: int) -> None:
+        """Record a backend generation; pages of older generations can't be served again"""
+        if self._generation is None or generation > self._generation:
+            if self._generation is not None:
+                self._epoch += 1
+                self.pages.clear()
+            self._generation = generation
+
+    async def publish(self, server_detail: ServerDetail) -> None:
+        """Publish a new server and invalidate what it changes"""
+        retired = await self.database.latest_versions([server_detail.name])
+        try:
+            await self.database.publish(server_detail)
+        finally:
+            self._invalidate(retired.values(), [server_detail])
+
+    async def publish_many(self, servers: List[ServerDetail]) -> List[Optional[DatabaseError]]:
+        """Publish several servers and invalidate what they change"""
+        retired = await self.database.latest_versions(
+            list(dict.fromkeys(server.name for server in servers if server.name))
+        )
+        try:
+            results = await self.database.publish_many(servers)
+        except Exception:
+            self._invalidate(retired.values(), servers)
+            raise
+
+        self._invalidate(
+            retired.values(),
+            [server for server, error in zip(servers, results) if error is None],
+        )
+        return results
+
+    def _invalidate(
+        self, retired: Iterable[ServerDetail], published: List[ServerDetail]
+    ) -> None:
+        """Drop the cached records a publish may have changed, and all pages"""
+        self._epoch += 1
+        for server_detail in itertools.chain(retired, published):
+            self.details.pop(server_detail.id)
+        # The publish moved the backend generation, so no page is current
+        self.pages.clear()
+
+    async def import_seed(self, seed_file_path: str) -> None:
+        """Import initial data from a seed file and drop all cached reads"""
+        try:
+            await self.database.import_seed(seed_file_path)
+        finally:
+            self._epoch += 1
+            self.details.clear()
+            self.pages.clear()
+
+    async def close(self) -> None:
+        """Close the underlying database"""
+        await self.database.close()
+
+    def connection_info(self) -> ConnectionInfo:
+        """Get connection information of the underlying database"""
+        return self.database.connection_info()
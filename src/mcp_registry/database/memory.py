@@ -1,19 +1,39 @@
 import asyncio
-import json
+import bisect
+import itertools
+import time
 import uuid
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Set, Tuple
 
 from ..models import Server, ServerDetail
 from .base import (
     Database,
+    DatabaseError,
     ConnectionType,
     ConnectionInfo,
     NotFoundError,
     AlreadyExistsError,
+    ChangesExpiredError,
     InvalidInputError,
     InvalidVersionError,
+    content_hash,
+    filter_values,
 )
+from .persistence import MemoryStore
+from .search import SMALL_BATCH, PrefixIndex, SearchIndex, parse_search_cursor, search_terms
+from .seed import SeedProgress, validated_seed_batches
+from .versioning import VersionKey, version_key
+
+
+# Filter keys backed by a secondary index in MemoryDB
+INDEXED_FILTERS = ("name", "repoUrl", "version", "registryName", "packageName", "transportType")
+
+
+def _contains(sorted_ids: List[str], server_id: str) -> bool:
+    """Check whether a sorted ID list contains an ID"""
+    idx = bisect.bisect_left(sorted_ids, server_id)
+    return idx < len(sorted_ids) and sorted_ids[idx] == server_id
 
 
 def compare_semantic_versions(version1: str, version2: str) -> int:
@@ -24,52 +44,187 @@ def compare_semantic_versions(version1: str, version2: str) -> int:
          0 if version1 == version2
         +1 if version1 > version2
     """
-    def parse_version(version: str) -> List[int]:
-        parts = version.split(".")
-        # Convert to integers, default to 0 for non-numeric parts
-        result = []
-        for part in parts:
-            try:
-                result.append(int(part))
-            except ValueError:
-                result.append(0)
-        return result
-
-    parts1 = parse_version(version1)
-    parts2 = parse_version(version2)
-    
-    # Pad with zeros to make equal length
-    max_len = max(len(parts1), len(parts2))
-    parts1.extend([0] * (max_len - len(parts1)))
-    parts2.extend([0] * (max_len - len(parts2)))
-    
-    # Compare each part
-    for i in range(max_len):
-        if parts1[i] < parts2[i]:
-            return -1
-        elif parts1[i] > parts2[i]:
-            return 1
-    
-    return 0
+    key1 = version_key(version1)
+    key2 = version_key(version2)
+    return (key1 > key2) - (key1 < key2)
+
+
+def _merge_sorted(sorted_ids: List[str], new_ids: List[str]) -> List[str]:
+    """
+    Add IDs to a sorted ID list and return the resulting list
+
+    Small batches are inserted in place. Larger ones are merged into a
+    copy with one sort, which is cheaper than many inserts.
+    """
+    if len(new_ids) <= SMALL_BATCH:
+        for server_id in new_ids:
+            bisect.insort(sorted_ids, server_id)
+        return sorted_ids
+
+    merged = sorted_ids + sorted(new_ids)
+    merged.sort()
+    return merged
+
+
+class _VersionChain:
+    """Versions published under one server name, ordered by version key"""
+
+    __slots__ = ("keys", "ids", "by_version")
+
+    def __init__(self) -> None:
+        self.keys: List[VersionKey] = []
+        self.ids: List[str] = []
+        self.by_version: Dict[str, str] = {}
+
+    def latest_id(self) -> Optional[str]:
+        """ID of the highest version, or None if the chain is empty"""
+        return self.ids[-1] if self.ids else None
+
+    def add(self, version: str, server_id: str) -> None:
+        """Insert a version, after any existing versions with an equal key"""
+        key = version_key(version)
+        idx = bisect.bisect_right(self.keys, key)
+        self.keys.insert(idx, key)
+        self.ids.insert(idx, server_id)
+        self.by_version[version] = server_id
+
+    def remove(self, version: str, server_id: str) -> None:
+        """Remove a version previously added with add()"""
+        key = version_key(version)
+        idx = bisect.bisect_left(self.keys, key)
+        while idx < len(self.keys) and self.keys[idx] == key:
+            if self.ids[idx] == server_id:
+                del self.keys[idx]
+                del self.ids[idx]
+                break
+            idx += 1
+        if self.by_version.get(version) == server_id:
+            del self.by_version[version]
+
+
+class _ChangeLog:
+    """
+    Ring buffer of the most recently written records by sequence number
+
+    Sequence numbers are consecutive, so the slot of a change is its
+    sequence number modulo the capacity. Only changes after start_seq
+    were recorded.
+    """
+
+    __slots__ = ("records", "start_seq", "last_seq")
+
+    def __init__(self, capacity: int, start_seq: int) -> None:
+        self.records: List[Optional[ServerDetail]] = [None] * capacity
+        self.start_seq = start_seq
+        self.last_seq = start_seq
+
+    def first_seq(self) -> int:
+        """Sequence number of the oldest retained change"""
+        return max(self.start_seq, self.last_seq - len(self.records)) + 1
+
+    def append(self, record: ServerDetail) -> None:
+        """Record a write, overwriting the oldest change when full"""
+        self.last_seq += 1
+        self.records[self.last_seq % len(self.records)] = record
+
+    def since(self, seq: int, limit: int) -> List[Tuple[int, ServerDetail]]:
+        """Get up to limit changes after seq, in order"""
+        if seq < self.first_seq() - 1 or seq > self.last_seq:
+            raise ChangesExpiredError(f"Changes after {seq} are no longer available")
+
+        end = min(seq + limit, self.last_seq)
+        return [(s, self.records[s % len(self.records)]) for s in range(seq + 1, end + 1)]
 
 
 class MemoryDB(Database):
-    """In-memory implementation of the Database interface"""
+    """
+    In-memory implementation of the Database interface
 
-    def __init__(self, initial_data: Optional[Dict[str, Server]] = None):
+    Reads never take a lock. Every change to the entries and indexes is
+    applied in a synchronous section with no await in between, so code on
+    the event loop always sees a consistent state. Writers serialize on
+    a write lock so that checks made before an await stay valid, and
+    long imports yield to the event loop between batches.
+
+    Stored records are never mutated: updates replace them with a new
+    copy, so records are handed out without copying. Callers must treat
+    returned records as read-only.
+
+    Latest versions are also kept in an inverted index for search(), and
+    server names in a sorted list for suggest().
+
+    With json_cache enabled, the JSON encoding of each ServerDetail and of
+    its Server summary is built when the record is stored and served
+    as-is by list_json() and get_json_by_id(), along with the ETag of
+    the detail encoding.
+
+    Every stored record is also appended to a change log of the last
+    change_log_size writes. Its sequence number doubles as the generation
+    and starts from the wall clock in milliseconds, so it keeps increasing
+    across restarts. Changes from before a restart are not retained. With
+    a data_dir, the sequence also resumes after the last number persisted,
+    in case imports handed out numbers faster than the clock advanced.
+
+    With a data_dir, every write is appended to a write-ahead log before
+    it is applied, and the log is compacted into a snapshot every
+    snapshot_interval records. connect() loads the snapshot and replays
+    the log.
+    """
+
+    def __init__(
+        self,
+        initial_data: Optional[Dict[str, Server]] = None,
+        import_batch_size: int = 500,
+        import_workers: int = 0,
+        json_cache: bool = True,
+        data_dir: Optional[str] = None,
+        snapshot_interval: int = 10000,
+        change_log_size: int = 100000,
+    ):
         self.entries: Dict[str, ServerDetail] = {}
-        self._lock = asyncio.Lock()
+        self.import_batch_size = import_batch_size
+        self.import_workers = import_workers
+        self.json_cache = json_cache
+        self.snapshot_interval = snapshot_interval
+        self._persistence = MemoryStore(data_dir) if data_dir else None
+        self._write_lock = asyncio.Lock()
+        self._compaction: Optional[asyncio.Task] = None
+
+        # Encoded (ServerDetail, Server summary) JSON per ID
+        self._encoded: Dict[str, Tuple[bytes, bytes]] = {}
+        # ETag of the encoded ServerDetail per ID
+        self._etags: Dict[str, str] = {}
+
+        self.change_log_size = change_log_size
+        self._changes = _ChangeLog(change_log_size, time.time_ns() // 1_000_000)
+        self._modified = datetime.now(timezone.utc)
         
         # Convert Server entries to ServerDetail entries if provided
         if initial_data:
             for server_id, server in initial_data.items():
-                self.entries[server_id] = ServerDetail(
+                self._store(ServerDetail(
                     id=server.id,
                     name=server.name,
                     description=server.description,
                     repository=server.repository,
                     version_detail=server.version_detail,
-                )
+                ))
+
+        # IDs kept in sorted order for keyset pagination
+        self._sorted_ids: List[str] = sorted(self.entries)
+
+        # Secondary indexes for list filters: filter key -> value -> sorted IDs
+        self._indexes: Dict[str, Dict[str, List[str]]] = {
+            key: {} for key in INDEXED_FILTERS
+        }
+        # Versions of each server name, ordered by version key
+        self._versions: Dict[str, _VersionChain] = {}
+        # Search terms of latest versions
+        self._search = SearchIndex()
+        # Server names, for prefix lookups
+        self._names = PrefixIndex()
+        for entry in self.entries.values():
+            self._index_entry(entry)
 
     async def list(
         self,
@@ -78,161 +233,584 @@ class MemoryDB(Database):
         limit: int = 10,
     ) -> Tuple[List[Server], Optional[str]]:
         """List servers with optional filtering and pagination"""
-        async with self._lock:
-            if limit <= 0:
-                limit = 10
-
-            # Convert all entries to Server objects
-            all_servers = []
-            for entry in self.entries.values():
-                server = Server(
-                    id=entry.id,
-                    name=entry.name,
-                    description=entry.description,
-                    repository=entry.repository,
-                    version_detail=entry.version_detail,
-                )
-                all_servers.append(server)
-
-            # Apply filters
-            filtered_servers = []
-            for server in all_servers:
-                include = True
-                
-                if filter_params:
-                    for key, value in filter_params.items():
-                        if key == "name" and server.name != value:
-                            include = False
-                            break
-                        elif key == "repoUrl" and server.repository.url != value:
-                            include = False
-                            break
-                        elif key == "serverDetail.id" and server.id != value:
-                            include = False
-                            break
-                        elif key == "version" and server.version_detail.version != value:
-                            include = False
-                            break
-                
-                if include:
-                    filtered_servers.append(server)
-
-            # Sort by ID for consistent pagination
-            filtered_servers.sort(key=lambda s: s.id)
-
-            # Find starting point for cursor-based pagination
-            start_idx = 0
-            if cursor:
-                for i, server in enumerate(filtered_servers):
-                    if server.id == cursor:
-                        start_idx = i + 1
-                        break
-
-            # Apply pagination
-            end_idx = start_idx + limit
-            if end_idx > len(filtered_servers):
-                end_idx = len(filtered_servers)
-
-            result = filtered_servers[start_idx:end_idx] if start_idx < len(filtered_servers) else []
-
-            # Determine next cursor
-            next_cursor = None
-            if end_idx < len(filtered_servers):
-                next_cursor = filtered_servers[end_idx - 1].id
-
-            return result, next_cursor
+        page_ids, next_cursor = self._page(filter_params, cursor, limit)
+        return [self._to_server(self.entries[server_id]) for server_id in page_ids], next_cursor
+
+    async def list_json(
+        self,
+        filter_params: Optional[Dict[str, Any]] = None,
+        cursor: Optional[str] = None,
+        limit: int = 10,
+    ) -> Tuple[List[bytes], Optional[str]]:
+        """List servers as JSON-encoded Server summaries"""
+        if not self.json_cache:
+            return await super().list_json(filter_params, cursor, limit)
+
+        page_ids, next_cursor = self._page(filter_params, cursor, limit)
+        return [self._encoded[server_id][1] for server_id in page_ids], next_cursor
+
+    async def count(self, filter_params: Optional[Dict[str, Any]] = None) -> int:
+        """Count servers matching the filters, from the index sizes"""
+        candidates = self._match_filters(filter_params) if filter_params else None
+        if candidates is None:
+            return len(self._sorted_ids)
+        if len(candidates) == 1:
+            return len(candidates[0])
+        return sum(1 for _ in self._intersect(candidates, 0))
+
+    async def search(
+        self,
+        query: str,
+        cursor: Optional[str] = None,
+        limit: int = 10,
+    ) -> Tuple[List[Server], Optional[str]]:
+        """Search latest server versions through the inverted index"""
+        page_ids, next_cursor = self._search_page(query, cursor, limit)
+        return [self._to_server(self.entries[server_id]) for server_id in page_ids], next_cursor
+
+    async def search_json(
+        self,
+        query: str,
+        cursor: Optional[str] = None,
+        limit: int = 10,
+    ) -> Tuple[List[bytes], Optional[str]]:
+        """Search servers, returning JSON-encoded Server summaries"""
+        if not self.json_cache:
+            return await super().search_json(query, cursor, limit)
+
+        page_ids, next_cursor = self._search_page(query, cursor, limit)
+        return [self._encoded[server_id][1] for server_id in page_ids], next_cursor
+
+    def _search_page(
+        self, query: str, cursor: Optional[str], limit: int
+    ) -> Tuple[List[str], Optional[str]]:
+        """Get the IDs of one page of search results and the cursor of the next one"""
+        if limit <= 0:
+            limit = 10
+
+        offset = parse_search_cursor(cursor)
+        page_ids, has_more = self._search.search(query, offset, limit)
+        return page_ids, str(offset + len(page_ids)) if has_more else None
+
+    async def suggest(self, prefix: str, limit: int = 10) -> List[Tuple[str, str]]:
+        """Complete a server name prefix by bisecting the sorted names"""
+        if limit <= 0:
+            limit = 10
+
+        return [
+            (name, self._versions[name].latest_id())
+            for name in self._names.complete(prefix, limit)
+        ]
+
+    def _page(
+        self,
+        filter_params: Optional[Dict[str, Any]],
+        cursor: Optional[str],
+        limit: int,
+    ) -> Tuple[List[str], Optional[str]]:
+        """Get the IDs of one page and the cursor of the next one"""
+        if limit <= 0:
+            limit = 10
+
+        # Apply filters through the secondary indexes
+        candidates = self._match_filters(filter_params) if filter_params else None
+        if candidates is not None and len(candidates) > 1:
+            start = bisect.bisect_right(candidates[0], cursor) if cursor else 0
+            ids = list(itertools.islice(self._intersect(candidates, start), limit + 1))
+            next_cursor = ids[limit - 1] if len(ids) > limit else None
+            return ids[:limit], next_cursor
+
+        ids = self._sorted_ids if candidates is None else candidates[0]
+
+        # Resume right after the cursor (keyset pagination)
+        start_idx = bisect.bisect_right(ids, cursor) if cursor else 0
+        end_idx = start_idx + limit
+
+        # Determine next cursor
+        next_cursor = None
+        if end_idx < len(ids):
+            next_cursor = ids[end_idx - 1]
+
+        return ids[start_idx:end_idx], next_cursor
+
+    def _match_filters(self, filter_params: Dict[str, Any]) -> Optional[List[List[str]]]:
+        """
+        Resolve filter parameters to the sorted ID lists that must all match
+
+        Returns None when no indexed filter applies. Lists are ordered from
+        the most selective and may be index lists themselves, so they must
+        not be modified.
+        """
+        candidates: List[List[str]] = []
+        for key, value in filter_params.items():
+            if key == "serverDetail.id":
+                candidates.append([value] if value in self.entries else [])
+            elif key in self._indexes:
+                candidates.append(self._indexes[key].get(value, []))
+
+        if not candidates:
+            return None
+
+        candidates.sort(key=len)
+        return candidates
+
+    @staticmethod
+    def _intersect(candidates: List[List[str]], start: int) -> Iterator[str]:
+        """Yield IDs of the first list from index start that are in all the others"""
+        first, rest = candidates[0], candidates[1:]
+        for server_id in itertools.islice(first, start, None):
+            if all(_contains(ids, server_id) for ids in rest):
+                yield server_id
+
+    def _index_entry(
+        self,
+        entry: ServerDetail,
+        new_ids: Optional[Dict[Tuple[str, str], List[str]]] = None,
+        new_names: Optional[List[str]] = None,
+    ) -> None:
+        """
+        Add an entry to the secondary indexes and its version chain
+
+        For batches, the entry's ID is collected per index value in new_ids
+        and the name of a new chain in new_names, for the caller to merge
+        in one go. Otherwise they are inserted right away.
+        """
+        for key, value in filter_values(entry):
+            if new_ids is None:
+                bisect.insort(self._indexes[key].setdefault(value, []), entry.id)
+            else:
+                new_ids.setdefault((key, value), []).append(entry.id)
+
+        chain = self._versions.get(entry.name)
+        if chain is None:
+            chain = self._versions[entry.name] = _VersionChain()
+            if new_names is None:
+                self._names.add(entry.name)
+            else:
+                new_names.append(entry.name)
+        chain.add(entry.version_detail.version, entry.id)
+        if entry.version_detail.is_latest:
+            self._search.add(entry.id, search_terms(entry))
+
+    def _unindex_entry(self, entry: ServerDetail) -> None:
+        """Remove an entry from the secondary indexes and its version chain"""
+        for key, value in filter_values(entry):
+            ids = self._indexes[key].get(value)
+            if ids is not None:
+                idx = bisect.bisect_left(ids, entry.id)
+                if idx < len(ids) and ids[idx] == entry.id:
+                    del ids[idx]
+                if not ids:
+                    del self._indexes[key][value]
+
+        self._search.remove(entry.id)
+
+        chain = self._versions.get(entry.name)
+        if chain is not None:
+            chain.remove(entry.version_detail.version, entry.id)
+            if not chain.ids:
+                del self._versions[entry.name]
+                self._names.remove(entry.name)
+
+    def _store(self, entry: ServerDetail) -> None:
+        """Store a record, encoding it if the JSON cache is enabled"""
+        self.entries[entry.id] = entry
+        if self.json_cache:
+            detail = entry.model_dump_json().encode()
+            self._encoded[entry.id] = (detail, self._to_server(entry).model_dump_json().encode())
+            self._etags[entry.id] = f'"{content_hash(detail)}"'
+
+    @staticmethod
+    def _to_server(entry: ServerDetail) -> Server:
+        """Build the Server summary for a stored entry"""
+        return Server(
+            id=entry.id,
+            name=entry.name,
+            description=entry.description,
+            repository=entry.repository,
+            version_detail=entry.version_detail,
+        )
 
     async def get_by_id(self, id: str) -> ServerDetail:
         """Get a server by its ID"""
-        async with self._lock:
-            if id in self.entries:
-                # Return a copy
-                entry = self.entries[id]
-                return ServerDetail.model_validate(entry.model_dump())
-            
+        entry = self.entries.get(id)
+        if entry is None:
+            raise NotFoundError(f"Server with ID {id} not found")
+
+        # Stored records are immutable, so they can be shared as-is
+        return entry
+
+    async def get_json_by_id(self, id: str) -> bytes:
+        """Get the JSON-encoded ServerDetail of a server by its ID"""
+        if not self.json_cache:
+            return await super().get_json_by_id(id)
+
+        encoded = self._encoded.get(id)
+        if encoded is None:
+            raise NotFoundError(f"Server with ID {id} not found")
+
+        return encoded[0]
+
+    async def get_many(self, ids: List[str]) -> Dict[str, ServerDetail]:
+        """Get several servers by ID"""
+        entries = self.entries
+        return {id: entries[id] for id in ids if id in entries}
+
+    async def latest_versions(self, names: List[str]) -> Dict[str, ServerDetail]:
+        """Get the latest version of several servers by name, from the version chains"""
+        latest = {}
+        for name in names:
+            chain = self._versions.get(name)
+            if chain and chain.ids:
+                latest[name] = self.entries[chain.latest_id()]
+        return latest
+
+    async def get_many_json(self, ids: List[str]) -> Dict[str, bytes]:
+        """Get the JSON-encoded ServerDetails of several servers by ID"""
+        if not self.json_cache:
+            return await super().get_many_json(ids)
+
+        encoded = self._encoded
+        return {id: encoded[id][0] for id in ids if id in encoded}
+
+    async def etag(self, id: str) -> str:
+        """Get the ETag of a server's detail representation"""
+        if not self.json_cache:
+            return await super().etag(id)
+
+        etag = self._etags.get(id)
+        if etag is None:
+            raise NotFoundError(f"Server with ID {id} not found")
+
+        return etag
+
+    async def get_json_with_etag(self, id: str) -> Tuple[bytes, str]:
+        """Get the JSON-encoded ServerDetail of a server and its ETag together"""
+        if not self.json_cache:
+            return await super().get_json_with_etag(id)
+
+        encoded = self._encoded.get(id)
+        if encoded is None:
             raise NotFoundError(f"Server with ID {id} not found")
 
+        return encoded[0], self._etags[id]
+
+    async def export_json(self, batch_size: int = 500) -> AsyncIterator[bytes]:
+        """
+        Stream the latest version of every server as NDJSON
+
+        Walks the sorted IDs with a keyset cursor, one batch per step, so
+        no copy of the catalog is made. Stored records are immutable, so
+        each batch is a consistent snapshot of its records.
+        """
+        cursor = None
+        while True:
+            ids = self._sorted_ids
+            start = bisect.bisect_right(ids, cursor) if cursor is not None else 0
+            batch_ids = ids[start:start + batch_size]
+            if not batch_ids:
+                return
+            cursor = batch_ids[-1]
+
+            lines = []
+            for server_id in batch_ids:
+                entry = self.entries[server_id]
+                if not entry.version_detail.is_latest:
+                    continue
+                if self.json_cache:
+                    lines.append(self._encoded[server_id][0])
+                else:
+                    lines.append(entry.model_dump_json().encode())
+
+            if lines:
+                yield b"\n".join(lines) + b"\n"
+            else:
+                # Let other tasks run across long runs of older versions
+                await asyncio.sleep(0)
+
+    async def changes(
+        self, since: int, limit: int
+    ) -> Tuple[List[Tuple[int, ServerDetail]], int, bool]:
+        """Get the records written after a change sequence number"""
+        changes = self._changes.since(since, limit)
+        next_since = changes[-1][0] if changes else since
+        return changes, next_since, next_since < self._changes.last_seq
+
+    async def change_seq(self) -> int:
+        """Get the sequence number to follow changes from"""
+        return self._changes.last_seq
+
+    async def generation(self) -> Tuple[int, datetime]:
+        """Get the registry generation"""
+        return self._changes.last_seq, self._modified
+
     async def publish(self, server_detail: ServerDetail) -> None:
         """Publish a new server"""
-        async with self._lock:
-            # Validate input
-            if not server_detail.name:
-                raise InvalidInputError("Server name is required")
-            
-            if not server_detail.repository.url:
-                raise InvalidInputError("Repository URL is required")
-
-            # Check for existing versions
-            latest_version = ""
-            for entry in self.entries.values():
-                if entry.name == server_detail.name:
-                    if entry.version_detail.version == server_detail.version_detail.version:
-                        raise AlreadyExistsError(
-                            f"Server {server_detail.name} version {server_detail.version_detail.version} already exists"
+        error = (await self.publish_many([server_detail]))[0]
+        if error is not None:
+            raise error
+
+    async def publish_many(self, servers: List[ServerDetail]) -> List[Optional[DatabaseError]]:
+        """
+        Publish several servers with one group commit
+
+        All items are checked against the stored versions and each other,
+        then the accepted ones are written with a single log append
+        through the same commit path as seed imports.
+
+        The commit is shielded from cancellation, so a caller that times
+        out never leaves a record logged but not applied. Compaction runs
+        in the background rather than in the publishing call.
+        """
+        return await asyncio.shield(self._publish_many(servers))
+
+    async def _publish_many(self, servers: List[ServerDetail]) -> List[Optional[DatabaseError]]:
+        """Check and commit a publish under the write lock"""
+        async with self._write_lock:
+            results, records = self._prepare_publish(servers)
+            await self._commit_batch(records)
+
+        self._schedule_compaction()
+        return results
+
+    def _prepare_publish(
+        self, servers: List[ServerDetail]
+    ) -> Tuple[List[Optional[DatabaseError]], List[ServerDetail]]:
+        """
+        Check servers to publish and build the records to store
+
+        Returns:
+            Tuple of (error or None per server, records to store in order)
+        """
+        results: List[Optional[DatabaseError]] = []
+        records: Dict[str, ServerDetail] = {}
+        # Latest version per name, stored or published earlier in the batch
+        latest: Dict[str, Optional[ServerDetail]] = {}
+        published: Dict[str, Set[str]] = {}
+
+        for server_detail in servers:
+            name = server_detail.name
+            version = server_detail.version_detail.version
+            try:
+                # Validate input
+                if not name:
+                    raise InvalidInputError("Server name is required")
+
+                if not server_detail.repository.url:
+                    raise InvalidInputError("Repository URL is required")
+
+                # Check against the existing versions of this server
+                chain = self._versions.get(name)
+                if name not in latest:
+                    latest[name] = self.entries[chain.latest_id()] if chain else None
+                previous = latest[name]
+
+                if (chain and version in chain.by_version) or version in published.get(name, ()):
+                    raise AlreadyExistsError(f"Server {name} version {version} already exists")
+
+                if previous is not None:
+                    latest_version = previous.version_detail.version
+                    if version_key(version) < version_key(latest_version):
+                        raise InvalidVersionError(
+                            f"Cannot publish older version {version} after newer version {latest_version}"
                         )
-                    
-                    # Track the latest version
-                    if not latest_version or compare_semantic_versions(entry.version_detail.version, latest_version) > 0:
-                        latest_version = entry.version_detail.version
-
-            # Check version ordering
-            if latest_version and compare_semantic_versions(server_detail.version_detail.version, latest_version) < 0:
-                raise InvalidVersionError(
-                    f"Cannot publish older version {server_detail.version_detail.version} after newer version {latest_version}"
-                )
+            except DatabaseError as e:
+                results.append(e)
+                continue
 
             # Generate ID and set metadata
             server_detail.id = str(uuid.uuid4())
             server_detail.version_detail.is_latest = True
             server_detail.version_detail.release_date = datetime.now().isoformat()
 
-            # Store a copy
-            self.entries[server_detail.id] = ServerDetail.model_validate(server_detail.model_dump())
+            # Store a private copy so later changes by the caller don't leak in
+            stored = ServerDetail.model_validate(server_detail.model_dump())
+
+            # The replaced version is no longer the latest
+            if previous is not None:
+                records[previous.id] = previous.model_copy(
+                    update={
+                        "version_detail": previous.version_detail.model_copy(
+                            update={"is_latest": False}
+                        )
+                    }
+                )
+
+            records[stored.id] = stored
+            latest[name] = stored
+            published.setdefault(name, set()).add(version)
+            results.append(None)
+
+        return results, list(records.values())
 
     async def import_seed(self, seed_file_path: str) -> None:
-        """Import initial data from a seed file"""
+        """Import initial data from a JSON array or NDJSON seed file"""
+        progress = SeedProgress("memory database")
+
+        async for servers, errors in validated_seed_batches(
+            seed_file_path, self.import_batch_size, self.import_workers
+        ):
+            # The lock is held per batch, so publishes run between batches
+            async with self._write_lock:
+                await self._commit_batch(self._keep_newer_latest(servers))
+            self._schedule_compaction()
+            progress.add(errors, imported=len(servers))
+            # Let readers run between batches
+            await asyncio.sleep(0)
+
+        progress.finish()
+
+    def _keep_newer_latest(self, servers: List[ServerDetail]) -> List[ServerDetail]:
+        """
+        Clear the latest flag of seed records that have a newer stored version
+
+        Re-importing the seed over persisted data must not bring back a
+        version that a later publish retired.
+        """
+        reconciled = []
+        for server in servers:
+            chain = self._versions.get(server.name)
+            latest_id = chain.latest_id() if chain else None
+            if (
+                server.version_detail.is_latest
+                and latest_id is not None
+                and latest_id != server.id
+                and version_key(self.entries[latest_id].version_detail.version)
+                > version_key(server.version_detail.version)
+            ):
+                server = server.model_copy(
+                    update={
+                        "version_detail": server.version_detail.model_copy(
+                            update={"is_latest": False}
+                        )
+                    }
+                )
+            reconciled.append(server)
+        return reconciled
+
+    async def _commit_batch(self, servers: List[ServerDetail]) -> None:
+        """Persist and store imported servers that differ from the stored ones"""
+        changed = [server for server in servers if self.entries.get(server.id) != server]
+        await self._persist(changed)
+        for server in self._store_batch(changed):
+            self._changes.append(server)
+        if changed:
+            self._modified = datetime.now(timezone.utc)
+
+    def _store_batch(self, servers: List[ServerDetail]) -> List[ServerDetail]:
+        """
+        Store imported servers, replacing entries with the same ID
+
+        Returns:
+            The stored records, one per ID
+        """
+        # The last record for an ID wins
+        servers = list({server.id: server for server in servers}.values())
+
+        new_ids = []
+        new_index_ids: Dict[Tuple[str, str], List[str]] = {}
+        new_names: List[str] = []
+        for server in servers:
+            previous = self.entries.get(server.id)
+            if previous is not None:
+                self._unindex_entry(previous)
+            else:
+                new_ids.append(server.id)
+            self._store(server)
+            self._index_entry(server, new_index_ids, new_names)
+
+        # A chain created earlier in the batch may have been emptied again
+        self._names.add_many([name for name in dict.fromkeys(new_names) if name in self._versions])
+
+        # Merge new IDs into fresh sorted lists and swap them in
+        for (key, value), ids in new_index_ids.items():
+            self._indexes[key][value] = _merge_sorted(self._indexes[key].get(value, []), ids)
+        if new_ids:
+            self._sorted_ids = _merge_sorted(self._sorted_ids, new_ids)
+
+        return servers
+
+    async def connect(self) -> None:
+        """Load persisted records (no-op without a data directory)"""
+        if self._persistence is None:
+            return
+
+        records = await asyncio.to_thread(self._persistence.open)
+
+        # Every logged record took at most one sequence number
+        persisted_seq = self._persistence.last_seq + self._persistence.log_records
+        if persisted_seq > self._changes.last_seq:
+            self._changes = _ChangeLog(self.change_log_size, persisted_seq)
+
+        servers = []
+        for record in records:
+            try:
+                servers.append(ServerDetail.model_validate_json(record))
+            except ValueError as e:
+                print(f"Skipping unreadable persisted record: {e}")
+
+        async with self._write_lock:
+            self._store_batch(servers)
+            self._modified = datetime.now(timezone.utc)
+
+        print(f"Loaded {len(self.entries)} servers from {self._persistence.data_dir}")
+
+    async def _persist(self, records: List[ServerDetail]) -> None:
+        """Append records to the write-ahead log before they are applied"""
+        if self._persistence is None or not records:
+            return
+
+        encoded = [record.model_dump_json().encode() for record in records]
+        await asyncio.to_thread(self._persistence.append, encoded)
+
+    def _schedule_compaction(self) -> None:
+        """Start a background compaction once one is due"""
+        if self._persistence is None or self._persistence.log_records < self.snapshot_interval:
+            return
+        if self._compaction is None or self._compaction.done():
+            self._compaction = asyncio.create_task(self._compact())
+
+    async def _compact(self) -> None:
+        """Compact under the write lock, reporting failures"""
         try:
-            with open(seed_file_path, 'r') as f:
-                seed_data = json.load(f)
-        except FileNotFoundError:
-            raise InvalidInputError(f"Seed file not found: {seed_file_path}")
-        except json.JSONDecodeError as e:
-            raise InvalidInputError(f"Invalid JSON in seed file: {e}")
-
-        # Validate seed data format
-        if not isinstance(seed_data, list):
-            raise InvalidInputError("Seed data must be a list of servers")
-
-        print(f"Importing {len(seed_data)} servers into memory database")
-
-        async with self._lock:
-            for i, server_data in enumerate(seed_data):
-                try:
-                    server = ServerDetail.model_validate(server_data)
-                    
-                    if not server.id or not server.name:
-                        print(f"Skipping server {i + 1}: ID or Name is empty")
-                        continue
-
-                    # Set default version if missing
-                    if not server.version_detail.version:
-                        server.version_detail.version = "0.0.1-seed"
-                        server.version_detail.release_date = datetime.now().isoformat()
-                        server.version_detail.is_latest = True
-
-                    # Store the server
-                    self.entries[server.id] = server
-                    print(f"[{i + 1}/{len(seed_data)}] Imported server: {server.name}")
-                    
-                except Exception as e:
-                    print(f"Error importing server {i + 1}: {e}")
-                    continue
+            async with self._write_lock:
+                await self._compact_if_due()
+        except Exception as e:
+            print(f"Error compacting persisted records: {e}")
+
+    async def _compact_if_due(self) -> None:
+        """Write a snapshot once the log holds snapshot_interval records"""
+        if self._persistence is not None and self._persistence.log_records >= self.snapshot_interval:
+            await self._write_snapshot()
 
-        print("Memory database import completed successfully")
+    async def _write_snapshot(self) -> None:
+        """Write every stored record to a new snapshot and empty the log"""
+        # Records are immutable, so encoding them off the event loop is safe
+        entries = list(self.entries.values())
+        if self.json_cache:
+            records = [self._encoded[entry.id][0] for entry in entries]
+            await asyncio.to_thread(
+                self._persistence.write_snapshot, records, self._changes.last_seq
+            )
+        else:
+            await asyncio.to_thread(
+                self._persistence.write_snapshot,
+                (entry.model_dump_json().encode() for entry in entries),
+                self._changes.last_seq,
+            )
 
     async def close(self) -> None:
-        """Close the database connection (no-op for memory DB)"""
-        pass
+        """Compact and close the persistent store, if any"""
+        if self._persistence is None:
+            return
+
+        if self._compaction is not None:
+            await self._compaction
+
+        async with self._write_lock:
+            if self._persistence.log_records:
+                await self._write_snapshot()
+            self._persistence.close()
 
     def connection_info(self) -> ConnectionInfo:
         """Get connection information"""
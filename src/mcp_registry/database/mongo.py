@@ -1,33 +1,196 @@
-import json
+import asyncio
+import logging
+import re
+import time
 import uuid
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Set, Tuple, Type
 
+import pydantic_core
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase, AsyncIOMotorCollection
-from pymongo import errors as pymongo_errors
+from pydantic import BaseModel
+from pymongo import InsertOne, ReturnDocument, UpdateOne, errors as pymongo_errors
 
 from ..models import Server, ServerDetail
 from .base import (
     Database,
+    DatabaseError,
     ConnectionType,
     ConnectionInfo,
     NotFoundError,
     AlreadyExistsError,
     InvalidInputError,
     InvalidVersionError,
+    content_hash,
 )
+from .search import FIELD_WEIGHTS, parse_search_cursor, tokenize
+from .seed import SeedProgress, validated_seed_batches
+from .versioning import version_sort_key
+
+
+logger = logging.getLogger(__name__)
+
+# Version of the stored document layout. Documents carrying the current
+# version were validated on write and can be read without validation.
+SCHEMA_VERSION = 1
+
+# Fields of a Server summary, for list queries
+SUMMARY_PROJECTION = {
+    "_id": 0,
+    "id": 1,
+    "name": 1,
+    "description": 1,
+    "repository": 1,
+    "version_detail": 1,
+    "schema_version": 1,
+}
+
+# Fields of a ServerDetail, for detail queries
+DETAIL_PROJECTION = {"_id": 0, "version_sort_key": 0, "content_hash": 0, "seq": 0, "changed_at": 0}
+
+# Fields of a ServerDetail and its content hash
+DETAIL_HASH_PROJECTION = {"_id": 0, "version_sort_key": 0, "seq": 0, "changed_at": 0}
+
+# Fields of a ServerDetail and its last change, for the change feed
+CHANGE_PROJECTION = {"_id": 0, "version_sort_key": 0, "content_hash": 0}
+
+# Fields needed to build the ETag of a ServerDetail
+ETAG_PROJECTION = {"_id": 0, "content_hash": 1, "version_detail.is_latest": 1}
+
+# Only latest versions are ever listed, so the list indexes are partial
+LATEST = {"version_detail.is_latest": True}
+
+# (keys, options) of the indexes used by the list, filter and publish queries
+INDEXES = [
+    ([("id", 1)], {"unique": True}),
+    ([("name", 1)], {}),
+    ([("name", 1), ("version_detail.version", 1)], {"unique": True}),
+    (
+        [("version_detail.is_latest", 1), ("id", 1)],
+        {"name": "latest_by_id", "partialFilterExpression": LATEST},
+    ),
+    (
+        [("name", 1), ("version_detail.is_latest", 1)],
+        {"name": "one_latest_per_name", "unique": True, "partialFilterExpression": LATEST},
+    ),
+    (
+        [("name", 1), ("id", 1)],
+        {"name": "latest_by_name", "partialFilterExpression": LATEST},
+    ),
+    (
+        [("repository.url", 1), ("id", 1)],
+        {"name": "latest_by_repository", "partialFilterExpression": LATEST},
+    ),
+    (
+        [("version_detail.version", 1), ("id", 1)],
+        {"name": "latest_by_version", "partialFilterExpression": LATEST},
+    ),
+    (
+        [("packages.registry_name", 1), ("id", 1)],
+        {"name": "latest_by_registry_name", "partialFilterExpression": LATEST},
+    ),
+    (
+        [("packages.name", 1), ("id", 1)],
+        {"name": "latest_by_package_name", "partialFilterExpression": LATEST},
+    ),
+    (
+        [("remotes.transport_type", 1), ("id", 1)],
+        {"name": "latest_by_transport_type", "partialFilterExpression": LATEST},
+    ),
+    # Without a language, terms are matched as-is with no stemming or stop words
+    (
+        [(field, "text") for field in FIELD_WEIGHTS],
+        {
+            "name": "latest_text",
+            "weights": {field: int(weight) for field, weight in FIELD_WEIGHTS.items()},
+            "default_language": "none",
+            "partialFilterExpression": LATEST,
+        },
+    ),
+    # Documents written before change sequence numbers existed have none
+    ([("seq", 1)], {"name": "changes_by_seq", "sparse": True}),
+]
+
+# Changes are only served once they are this old, so that writes which
+# drew a sequence number earlier but committed later are not skipped
+CHANGE_SETTLE_SECONDS = 5.0
+
+# Maximum number of distinct filter combinations with a cached count
+COUNT_CACHE_SIZE = 1024
+
+# Publish retries when a concurrent publish takes the latest slot
+PUBLISH_ATTEMPTS = 3
+
+# (name, filter, sort field) of the queries the registry runs
+CANONICAL_QUERIES = [
+    ("list", dict(LATEST), "id"),
+    ("list page", {**LATEST, "id": {"$gt": ""}}, "id"),
+    ("list by name", {**LATEST, "name": ""}, "id"),
+    ("list by repository", {**LATEST, "repository.url": ""}, "id"),
+    ("list by version", {**LATEST, "version_detail.version": ""}, "id"),
+    ("list by registry name", {**LATEST, "packages.registry_name": ""}, "id"),
+    ("list by package name", {**LATEST, "packages.name": ""}, "id"),
+    ("list by transport type", {**LATEST, "remotes.transport_type": ""}, "id"),
+    ("get by id", {"id": ""}, None),
+    ("get many", {"id": {"$in": ["", " "]}}, None),
+    ("search", {**LATEST, "$text": {"$search": "server"}}, None),
+    ("suggest", {**LATEST, "name": {"$regex": "^io\\.github\\."}}, "name"),
+    ("changes", {"seq": {"$gt": 0}}, "seq"),
+    ("publish latest lookup", {**LATEST, "name": "", "version_sort_key": {"$lte": ""}}, None),
+]
+
+# List filter keys and the document fields they match
+FILTER_FIELDS = {
+    "name": "name",
+    "repoUrl": "repository.url",
+    "serverDetail.id": "id",
+    "version": "version_detail.version",
+    "registryName": "packages.registry_name",
+    "packageName": "packages.name",
+    "transportType": "remotes.transport_type",
+}
+
+
+def _plan_stages(plan: Dict[str, Any]) -> Iterator[str]:
+    """Yield the stage names of an explain() plan tree"""
+    if "stage" in plan:
+        yield plan["stage"]
+    for key in ("inputStage", "queryPlan"):
+        if key in plan:
+            yield from _plan_stages(plan[key])
+    for child in plan.get("inputStages", []):
+        yield from _plan_stages(child)
 
 
 class MongoDB(Database):
     """MongoDB implementation of the Database interface"""
 
-    def __init__(self, connection_uri: str, database_name: str, collection_name: str):
+    def __init__(
+        self,
+        connection_uri: str,
+        database_name: str,
+        collection_name: str,
+        import_batch_size: int = 500,
+        import_workers: int = 0,
+        check_query_plans: bool = True,
+        trusted_reads: bool = True,
+        count_cache_ttl: float = 30.0,
+    ):
         self.connection_uri = connection_uri
         self.database_name = database_name
         self.collection_name = collection_name
+        self.import_batch_size = import_batch_size
+        self.import_workers = import_workers
+        self.check_query_plans = check_query_plans
+        self.trusted_reads = trusted_reads
+        self.count_cache_ttl = count_cache_ttl
+        # Cached counts: sorted filter items -> (count, expiry on the monotonic clock)
+        self._counts: Dict[Tuple[Tuple[str, str], ...], Tuple[int, float]] = {}
         self.client: Optional[AsyncIOMotorClient] = None
         self.database: Optional[AsyncIOMotorDatabase] = None
         self.collection: Optional[AsyncIOMotorCollection] = None
+        # Bookkeeping documents (migrations) for the collection
+        self.meta: Optional[AsyncIOMotorCollection] = None
 
     async def connect(self) -> None:
         """Connect to MongoDB and setup indexes"""
@@ -38,16 +201,56 @@ class MongoDB(Database):
         
         self.database = self.client[self.database_name]
         self.collection = self.database[self.collection_name]
+        self.meta = self.database[f"{self.collection_name}_meta"]
+
+        await self._backfill_version_sort_keys()
+        await self._resume_seqs()
 
         # Create indexes for better query performance
-        try:
-            await self.collection.create_index("name")
-            await self.collection.create_index("id", unique=True)
-            await self.collection.create_index([("name", 1), ("version_detail.version", 1)], unique=True)
-        except pymongo_errors.OperationFailure as e:
-            if e.code != 86:  # Index already exists
-                raise
-            print("Indexes already exist, skipping.")
+        for keys, options in INDEXES:
+            try:
+                await self.collection.create_index(keys, **options)
+            except pymongo_errors.OperationFailure as e:
+                if e.code == 86:  # Index already exists
+                    print(f"Index {keys} already exists with other options, skipping.")
+                elif e.code == 11000 and options.get("name") == "one_latest_per_name":
+                    # Publishes rely on this index to never promote an older
+                    # version, so startup fails if it still can't be built
+                    await self._retire_duplicate_latest()
+                    await self.collection.create_index(keys, **options)
+                elif e.code == 11000:  # Existing documents violate a unique index
+                    logger.warning("Cannot create unique index %s: %s", keys, e)
+                else:
+                    raise
+
+        if self.check_query_plans:
+            await self.check_indexes()
+
+    async def check_indexes(self) -> List[str]:
+        """
+        Explain each canonical query and warn about those not served by an index
+
+        Returns:
+            Names of the queries that need a collection scan or an in-memory sort
+        """
+        if self.collection is None:
+            raise InvalidInputError("Database not connected")
+
+        unindexed = []
+        for name, query, sort in CANONICAL_QUERIES:
+            cursor_obj = self.collection.find(query).limit(1)
+            if sort:
+                cursor_obj = cursor_obj.sort(sort, 1)
+            explanation = await cursor_obj.explain()
+            stages = set(_plan_stages(explanation["queryPlanner"]["winningPlan"]))
+            if stages & {"COLLSCAN", "SORT"}:
+                logger.warning(
+                    "Query '%s' is not served by an index (plan stages: %s)",
+                    name,
+                    ", ".join(sorted(stages)),
+                )
+                unindexed.append(name)
+        return unindexed
 
     async def list(
         self,
@@ -56,161 +259,935 @@ class MongoDB(Database):
         limit: int = 10,
     ) -> Tuple[List[Server], Optional[str]]:
         """List servers with optional filtering and pagination"""
-        if not self.collection:
+        documents, next_cursor = await self._find_page(filter_params, cursor, limit)
+
+        # Convert to Server objects
+        servers = []
+        for doc in documents:
+            try:
+                server = Server.model_validate(doc)
+                servers.append(server)
+            except Exception as e:
+                print(f"Error parsing server document: {e}")
+                continue
+
+        return servers, next_cursor
+
+    async def list_json(
+        self,
+        filter_params: Optional[Dict[str, Any]] = None,
+        cursor: Optional[str] = None,
+        limit: int = 10,
+    ) -> Tuple[List[bytes], Optional[str]]:
+        """List servers as JSON-encoded Server summaries"""
+        documents, next_cursor = await self._find_page(filter_params, cursor, limit)
+
+        servers = []
+        for doc in documents:
+            try:
+                servers.append(self._encode(doc, Server))
+            except Exception as e:
+                print(f"Error parsing server document: {e}")
+                continue
+
+        return servers, next_cursor
+
+    async def _find_page(
+        self,
+        filter_params: Optional[Dict[str, Any]],
+        cursor: Optional[str],
+        limit: int,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Fetch the summary documents of one page and the cursor of the next one"""
+        if self.collection is None:
             raise InvalidInputError("Database not connected")
 
         if limit <= 0:
             limit = 10
 
-        # Build MongoDB filter
-        mongo_filter = {"version_detail.is_latest": True}
-        
-        if filter_params:
-            for key, value in filter_params.items():
-                if key == "version":
-                    mongo_filter["version_detail.version"] = value
-                elif key == "name":
-                    mongo_filter["name"] = value
-                else:
-                    mongo_filter[key] = value
+        mongo_filter = self._list_filter(filter_params)
 
-        # Handle cursor-based pagination
+        # Keyset pagination: the cursor is the last ID (the sort key) of the previous page
         if cursor:
             try:
                 uuid.UUID(cursor)  # Validate cursor format
             except ValueError:
                 raise InvalidInputError("Invalid cursor format")
-            
-            # Check if cursor document exists
-            cursor_doc = await self.collection.find_one({"id": cursor})
-            if cursor_doc:
-                mongo_filter["id"] = {"$gt": cursor}
-
-        # Execute query with sorting and limit
-        cursor_obj = self.collection.find(mongo_filter).sort("id", 1).limit(limit)
-        documents = await cursor_obj.to_list(length=limit)
+            mongo_filter["id"] = {"$gt": cursor}
+
+        # Fetch one extra summary document to detect whether another page exists
+        cursor_obj = (
+            self.collection.find(mongo_filter, SUMMARY_PROJECTION)
+            .sort("id", 1)
+            .limit(limit + 1)
+        )
+        documents = await cursor_obj.to_list(length=limit + 1)
+        has_more = len(documents) > limit
+        documents = documents[:limit]
+
+        # Determine next cursor
+        next_cursor = documents[-1]["id"] if has_more else None
+
+        return documents, next_cursor
+
+    @staticmethod
+    def _list_filter(filter_params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Build the MongoDB filter for list filter parameters"""
+        mongo_filter: Dict[str, Any] = {"version_detail.is_latest": True}
+        
+        if filter_params:
+            for key, value in filter_params.items():
+                mongo_filter[FILTER_FIELDS.get(key, key)] = value
+
+        return mongo_filter
+
+    async def count(self, filter_params: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Count latest servers matching the filters
+
+        Counts are cached for count_cache_ttl seconds. Publishes through
+        this instance keep the unfiltered total current and drop the
+        filtered counts; writes from other instances show up on expiry.
+        """
+        if self.collection is None:
+            raise InvalidInputError("Database not connected")
+
+        key = tuple(sorted((k, str(v)) for k, v in (filter_params or {}).items()))
+        now = time.monotonic()
+        cached = self._counts.get(key)
+        if cached and cached[1] > now:
+            return cached[0]
+
+        total = await self.collection.count_documents(self._list_filter(filter_params))
+        if len(self._counts) >= COUNT_CACHE_SIZE:
+            self._counts.clear()
+        self._counts[key] = (total, now + self.count_cache_ttl)
+        return total
+
+    def _count_published(self, replaced_latest: bool) -> None:
+        """Update cached counts after a publish through this instance"""
+        total = self._counts.get(())
+        self._counts.clear()
+        if total is not None:
+            self._counts[()] = (total[0] + (0 if replaced_latest else 1), total[1])
+
+    async def search(
+        self,
+        query: str,
+        cursor: Optional[str] = None,
+        limit: int = 10,
+    ) -> Tuple[List[Server], Optional[str]]:
+        """Search latest server versions through the text index"""
+        documents, next_cursor = await self._find_search_page(query, cursor, limit)
 
-        # Convert to Server objects
         servers = []
         for doc in documents:
             try:
-                server = Server.model_validate(doc)
-                servers.append(server)
+                servers.append(Server.model_validate(doc))
             except Exception as e:
                 print(f"Error parsing server document: {e}")
                 continue
 
-        # Determine next cursor
-        next_cursor = None
-        if len(servers) >= limit and servers:
-            next_cursor = servers[-1].id
+        return servers, next_cursor
+
+    async def search_json(
+        self,
+        query: str,
+        cursor: Optional[str] = None,
+        limit: int = 10,
+    ) -> Tuple[List[bytes], Optional[str]]:
+        """Search servers, returning JSON-encoded Server summaries"""
+        documents, next_cursor = await self._find_search_page(query, cursor, limit)
+
+        servers = []
+        for doc in documents:
+            try:
+                servers.append(self._encode(doc, Server))
+            except Exception as e:
+                print(f"Error parsing server document: {e}")
+                continue
 
         return servers, next_cursor
 
-    async def get_by_id(self, id: str) -> ServerDetail:
-        """Get a server by its ID"""
-        if not self.collection:
+    async def _find_search_page(
+        self, query: str, cursor: Optional[str], limit: int
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Fetch the summary documents of one page of search results and the next cursor"""
+        if self.collection is None:
             raise InvalidInputError("Database not connected")
 
-        document = await self.collection.find_one({"id": id})
-        if not document:
-            raise NotFoundError(f"Server with ID {id} not found")
+        if limit <= 0:
+            limit = 10
+
+        offset = parse_search_cursor(cursor)
+        terms = tokenize(query)
+        if not terms:
+            return [], None
+
+        # Quoting each term makes the text search require all of them
+        mongo_filter = {
+            **LATEST,
+            "$text": {"$search": " ".join(f'"{term}"' for term in dict.fromkeys(terms))},
+        }
+        projection = {**SUMMARY_PROJECTION, "score": {"$meta": "textScore"}}
+        cursor_obj = (
+            self.collection.find(mongo_filter, projection)
+            .sort([("score", {"$meta": "textScore"}), ("id", 1)])
+            .skip(offset)
+            .limit(limit + 1)
+        )
+        documents = await cursor_obj.to_list(length=limit + 1)
+        has_more = len(documents) > limit
+        documents = documents[:limit]
+        for doc in documents:
+            doc.pop("score", None)
+
+        return documents, str(offset + len(documents)) if has_more else None
+
+    async def suggest(self, prefix: str, limit: int = 10) -> List[Tuple[str, str]]:
+        """Complete a server name prefix with an anchored regex on the name index"""
+        if self.collection is None:
+            raise InvalidInputError("Database not connected")
+
+        if limit <= 0:
+            limit = 10
+
+        # An anchored, escaped prefix becomes a range scan on latest_by_name
+        cursor_obj = (
+            self.collection.find(
+                {**LATEST, "name": {"$regex": "^" + re.escape(prefix)}},
+                {"_id": 0, "name": 1, "id": 1},
+            )
+            .sort("name", 1)
+            .limit(limit)
+        )
+        documents = await cursor_obj.to_list(length=limit)
+        return [(doc["name"], doc["id"]) for doc in documents]
+
+    async def get_by_id(self, id: str) -> ServerDetail:
+        """Get a server by its ID"""
+        document = await self._find_by_id(id)
 
         try:
             return ServerDetail.model_validate(document)
         except Exception as e:
             raise InvalidInputError(f"Error parsing server document: {e}")
 
+    async def get_json_by_id(self, id: str) -> bytes:
+        """Get the JSON-encoded ServerDetail of a server by its ID"""
+        document = await self._find_by_id(id)
+
+        try:
+            return self._encode(document, ServerDetail)
+        except Exception as e:
+            raise InvalidInputError(f"Error parsing server document: {e}")
+
+    async def etag(self, id: str) -> str:
+        """
+        Get the ETag of a server's detail representation
+
+        Built from the stored content hash and the latest flag (the only
+        field changed after a write) with a projected point read.
+        """
+        document = await self._find_by_id(id, ETAG_PROJECTION)
+        if "content_hash" not in document:
+            return await super().etag(id)
+
+        return self._etag(document)
+
+    async def get_json_with_etag(self, id: str) -> Tuple[bytes, str]:
+        """Get the JSON-encoded ServerDetail of a server and its ETag from one document"""
+        document = await self._find_by_id(id, DETAIL_HASH_PROJECTION)
+        etag = self._etag(document) if "content_hash" in document else None
+        document.pop("content_hash", None)
+
+        try:
+            data = self._encode(document, ServerDetail)
+        except Exception as e:
+            raise InvalidInputError(f"Error parsing server document: {e}")
+
+        # Documents written before content hashes existed are hashed as served
+        return data, etag or f'"{content_hash(data)}"'
+
+    @staticmethod
+    def _etag(document: Dict[str, Any]) -> str:
+        """Build the ETag of a document from its content hash and latest flag"""
+        is_latest = document.get("version_detail", {}).get("is_latest")
+        return f'"{document["content_hash"]}-{1 if is_latest else 0}"'
+
+    async def export_json(self, batch_size: int = 500) -> AsyncIterator[bytes]:
+        """
+        Stream the latest version of every server as NDJSON
+
+        Reads one cursor over the latest_by_id index, batch_size documents
+        per round-trip, and yields each batch as soon as it is encoded.
+        """
+        if self.collection is None:
+            raise InvalidInputError("Database not connected")
+
+        cursor_obj = (
+            self.collection.find(LATEST, DETAIL_PROJECTION)
+            .sort("id", 1)
+            .batch_size(batch_size)
+        )
+        lines = []
+        async for doc in cursor_obj:
+            try:
+                lines.append(self._encode(doc, ServerDetail))
+            except Exception as e:
+                print(f"Error parsing server document: {e}")
+                continue
+
+            if len(lines) >= batch_size:
+                yield b"\n".join(lines) + b"\n"
+                lines = []
+
+        if lines:
+            yield b"\n".join(lines) + b"\n"
+
+    async def changes(
+        self, since: int, limit: int
+    ) -> Tuple[List[Tuple[int, ServerDetail]], int, bool]:
+        """
+        Get the records written after a change sequence number
+
+        Each document keeps the sequence number of its last write, so this
+        is a range scan of the changes_by_seq index returning the current
+        state of every document changed after since. Nothing expires, but
+        a document rewritten later is only returned at its newest sequence
+        number. The scan stops at the first change younger than
+        CHANGE_SETTLE_SECONDS.
+        """
+        if self.collection is None:
+            raise InvalidInputError("Database not connected")
+
+        horizon = datetime.now(timezone.utc) - timedelta(seconds=CHANGE_SETTLE_SECONDS)
+        cursor_obj = (
+            self.collection.find({"seq": {"$gt": since}}, CHANGE_PROJECTION)
+            .sort("seq", 1)
+            .limit(limit + 1)
+        )
+
+        changes = []
+        has_more = False
+        async for doc in cursor_obj:
+            # BSON dates come back as naive UTC
+            if len(changes) >= limit or doc.pop("changed_at").replace(tzinfo=timezone.utc) >= horizon:
+                has_more = True
+                break
+
+            seq = doc.pop("seq")
+            try:
+                changes.append((seq, ServerDetail.model_validate(doc)))
+            except Exception as e:
+                print(f"Error parsing server document: {e}")
+            since = seq
+
+        return changes, since, has_more
+
+    async def change_seq(self) -> int:
+        """Get the sequence number of the newest settled change"""
+        if self.collection is None:
+            raise InvalidInputError("Database not connected")
+
+        horizon = datetime.now(timezone.utc) - timedelta(seconds=CHANGE_SETTLE_SECONDS)
+        document = await self.collection.find_one(
+            {"seq": {"$gt": 0}, "changed_at": {"$lt": horizon}},
+            {"_id": 0, "seq": 1},
+            sort=[("seq", -1)],
+        )
+        return document["seq"] if document else 0
+
+    async def _reserve_seqs(self, count: int) -> int:
+        """
+        Reserve consecutive change sequence numbers for a write
+
+        Returns:
+            The first reserved sequence number
+        """
+        document = await self.meta.find_one_and_update(
+            {"_id": "seq"},
+            {"$inc": {"value": count}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+        return document["value"] - count + 1
+
+    async def _resume_seqs(self) -> None:
+        """Make sure the change sequence continues after the newest stored change"""
+        newest = await self.collection.find_one(
+            {"seq": {"$gt": 0}}, {"_id": 0, "seq": 1}, sort=[("seq", -1)]
+        )
+        if newest:
+            await self.meta.update_one(
+                {"_id": "seq"}, {"$max": {"value": newest["seq"]}}, upsert=True
+            )
+
+    @staticmethod
+    def _change(seq: int) -> Dict[str, Any]:
+        """Build the change fields to store with a write"""
+        return {"seq": seq, "changed_at": datetime.now(timezone.utc)}
+
+    async def generation(self) -> Tuple[int, datetime]:
+        """
+        Get the registry generation, shared by all instances through the meta collection
+
+        The generation is bumped after every committed write, never before
+        it, so a listing read under a generation includes all writes that
+        generation counts.
+        """
+        if self.meta is None:
+            raise InvalidInputError("Database not connected")
+
+        document = await self.meta.find_one({"_id": "generation"})
+        if not document:
+            return 0, datetime.fromtimestamp(0, timezone.utc)
+
+        # BSON dates come back as naive UTC
+        return document["value"], document["modified"].replace(tzinfo=timezone.utc)
+
+    async def _bump_generation(self) -> None:
+        """Record a committed change to the collection"""
+        await self.meta.update_one(
+            {"_id": "generation"},
+            {"$inc": {"value": 1}, "$currentDate": {"modified": True}},
+            upsert=True,
+        )
+
+    async def _find_by_id(
+        self, id: str, projection: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Fetch the document of a server by its ID"""
+        if self.collection is None:
+            raise InvalidInputError("Database not connected")
+
+        document = await self.collection.find_one({"id": id}, projection or DETAIL_PROJECTION)
+        if not document:
+            raise NotFoundError(f"Server with ID {id} not found")
+
+        return document
+
+    async def get_many(self, ids: List[str]) -> Dict[str, ServerDetail]:
+        """Get several servers by ID with one $in query"""
+        servers = {}
+        for document in await self._find_many(ids):
+            try:
+                servers[document["id"]] = ServerDetail.model_validate(document)
+            except Exception as e:
+                print(f"Error parsing server document: {e}")
+                continue
+
+        return servers
+
+    async def latest_versions(self, names: List[str]) -> Dict[str, ServerDetail]:
+        """Get the latest version of several servers by name with one $in query"""
+        if self.collection is None:
+            raise InvalidInputError("Database not connected")
+
+        unique_names = list(dict.fromkeys(names))
+        if not unique_names:
+            return {}
+
+        latest = {}
+        async for document in self.collection.find(
+            {**LATEST, "name": {"$in": unique_names}}, DETAIL_PROJECTION
+        ):
+            try:
+                latest[document["name"]] = ServerDetail.model_validate(document)
+            except Exception as e:
+                print(f"Error parsing server document: {e}")
+                continue
+
+        return latest
+
+    async def get_many_json(self, ids: List[str]) -> Dict[str, bytes]:
+        """Get the JSON-encoded ServerDetails of several servers by ID with one $in query"""
+        servers = {}
+        for document in await self._find_many(ids):
+            id = document["id"]
+            try:
+                servers[id] = self._encode(document, ServerDetail)
+            except Exception as e:
+                print(f"Error parsing server document: {e}")
+                continue
+
+        return servers
+
+    async def _find_many(self, ids: List[str]) -> List[Dict[str, Any]]:
+        """Fetch the documents of several servers by ID"""
+        if self.collection is None:
+            raise InvalidInputError("Database not connected")
+
+        unique_ids = list(dict.fromkeys(ids))
+        if not unique_ids:
+            return []
+
+        cursor_obj = self.collection.find({"id": {"$in": unique_ids}}, DETAIL_PROJECTION)
+        return await cursor_obj.to_list(length=len(unique_ids))
+
+    def _encode(self, document: Dict[str, Any], model: Type[BaseModel]) -> bytes:
+        """
+        Encode a document as the JSON of the given model
+
+        Documents written with the current schema version passed validation
+        on the way in, so in trusted mode they are encoded directly.
+        Anything else goes through the model.
+        """
+        if self.trusted_reads and document.pop("schema_version", None) == SCHEMA_VERSION:
+            return pydantic_core.to_json(document)
+        return model.model_validate(document).model_dump_json().encode()
+
     async def publish(self, server_detail: ServerDetail) -> None:
-        """Publish a new server"""
-        if not self.collection:
+        """
+        Publish a new server
+
+        The new version is inserted as not latest, then one ordered bulk
+        write retires the current latest version, if it is not newer, and
+        promotes the new one. The unique latest-per-name index rejects the
+        promotion while another version is latest: the publish fails if
+        that version is newer and is retried if a concurrent publish took
+        the slot. If the promotion fails otherwise, the retired version is
+        restored and the new one withdrawn.
+
+        The writes are shielded from cancellation, so a caller that times
+        out never leaves the name without a latest version or the new
+        version behind as an orphan.
+        """
+        if self.collection is None:
             raise InvalidInputError("Database not connected")
 
-        # Check for existing server with same name
-        existing_filter = {
-            "name": server_detail.name,
-            "version_detail.is_latest": True,
-        }
-        
-        existing_doc = await self.collection.find_one(existing_filter)
-        
-        if existing_doc:
-            existing_server = ServerDetail.model_validate(existing_doc)
-            if server_detail.version_detail.version <= existing_server.version_detail.version:
-                raise InvalidVersionError(
-                    f"Version must be greater than existing version {existing_server.version_detail.version}"
-                )
+        await asyncio.shield(self._publish(server_detail))
 
-        # Set metadata
+    async def _publish(self, server_detail: ServerDetail) -> None:
+        """Insert and promote a new version"""
+        # Set metadata; the version is inserted as not latest and promoted below
         server_detail.id = str(uuid.uuid4())
-        server_detail.version_detail.is_latest = True
+        server_detail.version_detail.is_latest = False
         server_detail.version_detail.release_date = datetime.now().isoformat()
+        document = self._to_document(server_detail)
 
-        # Insert new document
         try:
-            await self.collection.insert_one(server_detail.model_dump())
+            await self.collection.insert_one(document)
         except pymongo_errors.DuplicateKeyError:
-            raise AlreadyExistsError(f"Server {server_detail.name} version {server_detail.version_detail.version} already exists")
+            raise AlreadyExistsError(
+                f"Server {server_detail.name} version {server_detail.version_detail.version} already exists"
+            )
 
-        # Update existing entry to not be latest
-        if existing_doc:
-            await self.collection.update_one(
-                {"id": existing_doc["id"]},
-                {"$set": {"version_detail.is_latest": False}}
+        for attempt in range(PUBLISH_ATTEMPTS):
+            # One change for the retired version, one for the new one
+            seq = await self._reserve_seqs(2)
+            result, write_errors = await self._bulk_write(
+                [
+                    UpdateOne(
+                        {
+                            "name": server_detail.name,
+                            **LATEST,
+                            "version_sort_key": {"$lte": document["version_sort_key"]},
+                        },
+                        {"$set": {"version_detail.is_latest": False, **self._change(seq)}},
+                    ),
+                    UpdateOne(
+                        {"id": server_detail.id},
+                        {"$set": {"version_detail.is_latest": True, **self._change(seq + 1)}},
+                    ),
+                ],
+                ordered=True,
             )
+            if result.get("nModified"):
+                await self._bump_generation()
+            if not write_errors:
+                server_detail.version_detail.is_latest = True
+                # Matches of the promotion plus the retired version, if any
+                self._count_published(result.get("nMatched", 1) > 1)
+                return
 
-    async def import_seed(self, seed_file_path: str) -> None:
-        """Import initial data from a seed file"""
-        if not self.collection:
+            error = write_errors.get(1) or write_errors.get(0)
+            if error.get("code") != 11000:
+                if 1 in write_errors:
+                    await self._restore_latest([
+                        {"name": server_detail.name, "seq": seq, "version_detail.is_latest": False}
+                    ])
+                await self.collection.delete_one({"id": server_detail.id})
+                raise DatabaseError(error.get("errmsg", "Publish failed"))
+
+            # Another version is latest: either it is newer, or a concurrent
+            # publish took the latest slot between our retire and promote
+            existing_doc = await self.collection.find_one(
+                {"name": server_detail.name, **LATEST},
+                projection={"_id": 0, "version_detail.version": 1, "version_sort_key": 1},
+            )
+            if existing_doc and existing_doc.get("version_sort_key", "") > document["version_sort_key"]:
+                await self.collection.delete_one({"id": server_detail.id})
+                raise InvalidVersionError(
+                    f"Version must be greater than existing version {existing_doc['version_detail']['version']}"
+                )
+
+        await self.collection.delete_one({"id": server_detail.id})
+        raise InvalidVersionError(
+            f"Could not publish {server_detail.name}: concurrent publishes of the same server"
+        )
+
+    async def publish_many(self, servers: List[ServerDetail]) -> List[Optional[DatabaseError]]:
+        """
+        Publish several servers with a fixed number of round-trips
+
+        The latest versions of all names are read with one query and every
+        server is checked against them and the servers before it. Accepted
+        servers are inserted in one unordered bulk write as non-latest
+        versions. Then each name gets one ordered bulk write, all of them
+        sent concurrently, that retires its old latest version and promotes
+        its newest inserted version. If the promotion fails, because a
+        concurrent publish took the latest slot or otherwise, the retired
+        version is restored and the versions inserted for the name are
+        withdrawn and reported as failed.
+
+        The writes are shielded from cancellation like in publish().
+        """
+        if self.collection is None:
             raise InvalidInputError("Database not connected")
 
-        try:
-            with open(seed_file_path, 'r') as f:
-                seed_data = json.load(f)
-        except FileNotFoundError:
-            raise InvalidInputError(f"Seed file not found: {seed_file_path}")
-        except json.JSONDecodeError as e:
-            raise InvalidInputError(f"Invalid JSON in seed file: {e}")
+        return await asyncio.shield(self._publish_many(servers))
 
-        if not isinstance(seed_data, list):
-            raise InvalidInputError("Seed data must be a list of servers")
+    async def _publish_many(self, servers: List[ServerDetail]) -> List[Optional[DatabaseError]]:
+        """Check, insert and promote several servers"""
+        results: List[Optional[DatabaseError]] = [None] * len(servers)
 
-        print(f"Importing {len(seed_data)} servers into collection {self.collection.name}")
+        # Validate input
+        for i, server_detail in enumerate(servers):
+            if not server_detail.name:
+                results[i] = InvalidInputError("Server name is required")
+            elif not server_detail.repository.url:
+                results[i] = InvalidInputError("Repository URL is required")
 
-        for i, server_data in enumerate(seed_data):
-            try:
-                server = ServerDetail.model_validate(server_data)
-                
-                if not server.id or not server.name:
-                    print(f"Skipping server {i + 1}: ID or Name is empty")
-                    continue
-
-                # Set default version if missing
-                if not server.version_detail.version:
-                    server.version_detail.version = "0.0.1-seed"
-                    server.version_detail.release_date = datetime.now().isoformat()
-                    server.version_detail.is_latest = True
-
-                # Upsert the document
-                filter_doc = {"id": server.id}
-                update_doc = {"$set": server.model_dump()}
-                
-                result = await self.collection.update_one(
-                    filter_doc, update_doc, upsert=True
+        names = list(dict.fromkeys(
+            server_detail.name for i, server_detail in enumerate(servers) if results[i] is None
+        ))
+        if not names:
+            return results
+
+        # Current latest version of every name in one query
+        latest: Dict[str, Dict[str, Any]] = {}
+        async for doc in self.collection.find(
+            {**LATEST, "name": {"$in": names}},
+            {"_id": 0, "id": 1, "name": 1, "version_detail.version": 1, "version_sort_key": 1},
+        ):
+            latest[doc["name"]] = doc
+
+        # Check versions in order against the stored latest and earlier servers
+        newest = {
+            name: (doc.get("version_sort_key", ""), doc["version_detail"]["version"])
+            for name, doc in latest.items()
+        }
+        published: Dict[str, Set[str]] = {}
+        documents: Dict[int, Dict[str, Any]] = {}
+        for i, server_detail in enumerate(servers):
+            if results[i] is not None:
+                continue
+
+            name = server_detail.name
+            version = server_detail.version_detail.version
+            sort_key = version_sort_key(version)
+            if version in published.get(name, ()):
+                results[i] = AlreadyExistsError(f"Server {name} version {version} already exists")
+                continue
+            if name in newest and sort_key < newest[name][0]:
+                results[i] = InvalidVersionError(
+                    f"Version must be greater than existing version {newest[name][1]}"
                 )
-                
-                if result.upserted_id:
-                    print(f"[{i + 1}/{len(seed_data)}] Created server: {server.name}")
-                elif result.modified_count > 0:
-                    print(f"[{i + 1}/{len(seed_data)}] Updated server: {server.name}")
+                continue
+
+            # Set metadata; versions are inserted as not latest and promoted below
+            server_detail.id = str(uuid.uuid4())
+            server_detail.version_detail.is_latest = False
+            server_detail.version_detail.release_date = datetime.now().isoformat()
+            documents[i] = self._to_document(server_detail)
+            newest[name] = (sort_key, version)
+            published.setdefault(name, set()).add(version)
+
+        # Insert all accepted versions in one round-trip
+        indexes = list(documents)
+        _, write_errors = await self._bulk_write([InsertOne(documents[i]) for i in indexes])
+        inserted: Dict[str, List[int]] = {}
+        for position, i in enumerate(indexes):
+            error = write_errors.get(position)
+            server_detail = servers[i]
+            if error is None:
+                inserted.setdefault(server_detail.name, []).append(i)
+            elif error.get("code") == 11000:
+                results[i] = AlreadyExistsError(
+                    f"Server {server_detail.name} version {server_detail.version_detail.version} already exists"
+                )
+            else:
+                results[i] = DatabaseError(error.get("errmsg", "Insert failed"))
+
+        if not inserted:
+            return results
+
+        # One change per inserted version and per retired version
+        retired_names = [name for name in inserted if name in latest]
+        seq = await self._reserve_seqs(
+            len(retired_names) + sum(len(indexes_of_name) for indexes_of_name in inserted.values())
+        )
+
+        # Per name, stamp the inserted versions with their change, retire the
+        # old latest version and promote the newest inserted one. Each write is
+        # ordered, so a failure stops before the promotion.
+        retire_seqs: Dict[str, int] = {}
+        writes = []
+        for name, indexes_of_name in inserted.items():
+            requests = []
+            for i in indexes_of_name[:-1]:
+                requests.append(UpdateOne({"id": servers[i].id}, {"$set": self._change(seq)}))
+                seq += 1
+            if name in latest:
+                retire_seqs[name] = seq
+                requests.append(UpdateOne(
+                    {"id": latest[name]["id"], **LATEST},
+                    {"$set": {"version_detail.is_latest": False, **self._change(seq)}},
+                ))
+                seq += 1
+            requests.append(UpdateOne(
+                {"id": servers[indexes_of_name[-1]].id},
+                {"$set": {"version_detail.is_latest": True, **self._change(seq)}},
+            ))
+            seq += 1
+            writes.append(self._bulk_write(requests, ordered=True))
+
+        withdrawn = []
+        restored = []
+        for (name, indexes_of_name), (_, write_errors) in zip(
+            inserted.items(), await asyncio.gather(*writes)
+        ):
+            if not write_errors:
+                servers[indexes_of_name[-1]].version_detail.is_latest = True
+                continue
+
+            error = next(iter(write_errors.values()))
+            for i in indexes_of_name:
+                withdrawn.append(servers[i].id)
+                if error.get("code") == 11000:
+                    results[i] = InvalidVersionError(
+                        f"Could not publish {name}: concurrent publishes of the same server"
+                    )
                 else:
-                    print(f"[{i + 1}/{len(seed_data)}] Server already up to date: {server.name}")
-                    
-            except Exception as e:
-                print(f"Error importing server {i + 1}: {e}")
+                    results[i] = DatabaseError(error.get("errmsg", "Publish failed"))
+            if name in retire_seqs:
+                restored.append({"id": latest[name]["id"], "seq": retire_seqs[name]})
+
+        await self._restore_latest(restored)
+        if withdrawn:
+            await self.collection.delete_many({"id": {"$in": withdrawn}})
+
+        self._counts.clear()
+        await self._bump_generation()
+        return results
+
+    async def _restore_latest(self, retired: List[Dict[str, Any]]) -> None:
+        """
+        Make retired versions latest again after their replacement was not promoted
+
+        Each filter matches a version only if the failed write retired it.
+        If a concurrent publish took the latest slot since, the unique index
+        rejects the restore and that version stays latest.
+        """
+        if not retired:
+            return
+
+        seq = await self._reserve_seqs(len(retired))
+        await self._bulk_write([
+            UpdateOne(
+                version_filter,
+                {"$set": {"version_detail.is_latest": True, **self._change(seq + position)}},
+            )
+            for position, version_filter in enumerate(retired)
+        ])
+        await self._bump_generation()
+
+    async def _bulk_write(
+        self, requests: List[Any], ordered: bool = False
+    ) -> Tuple[Dict[str, Any], Dict[int, Dict[str, Any]]]:
+        """
+        Run a bulk write, collecting the errors of failed requests
+
+        Unordered by default; an ordered write stops at the first error.
+
+        Returns:
+            Tuple of (bulk API result, write error by request index)
+        """
+        if not requests:
+            return {}, {}
+
+        try:
+            result = (await self.collection.bulk_write(requests, ordered=ordered)).bulk_api_result
+        except pymongo_errors.BulkWriteError as e:
+            result = e.details
+
+        return result, {error["index"]: error for error in result.get("writeErrors", [])}
+
+    @staticmethod
+    def _to_document(server_detail: ServerDetail) -> Dict[str, Any]:
+        """Build the stored document for a validated server"""
+        document = server_detail.model_dump()
+        document["version_sort_key"] = version_sort_key(server_detail.version_detail.version)
+        document["schema_version"] = SCHEMA_VERSION
+        # The latest flag is flipped in place later, so it is left out of the hash
+        document["content_hash"] = content_hash(
+            server_detail.model_dump_json(exclude={"version_detail": {"is_latest"}}).encode()
+        )
+        return document
+
+    async def _backfill_version_sort_keys(self) -> None:
+        """Add version_sort_key to documents written before it existed (runs once)"""
+        migrations = await self.meta.find_one({"_id": "migrations"}) or {}
+        if migrations.get("version_sort_key"):
+            return
+
+        requests = []
+        async for doc in self.collection.find(
+            {"version_sort_key": {"$exists": False}},
+            {"_id": 0, "id": 1, "version_detail.version": 1},
+        ):
+            version = doc.get("version_detail", {}).get("version", "")
+            requests.append(
+                UpdateOne({"id": doc["id"]}, {"$set": {"version_sort_key": version_sort_key(version)}})
+            )
+            if len(requests) >= self.import_batch_size:
+                await self.collection.bulk_write(requests, ordered=False)
+                requests = []
+
+        if requests:
+            await self.collection.bulk_write(requests, ordered=False)
+
+        await self.meta.update_one(
+            {"_id": "migrations"}, {"$set": {"version_sort_key": True}}, upsert=True
+        )
+
+    async def _retire_duplicate_latest(self) -> None:
+        """Keep only the highest version of each name marked latest"""
+        retired = []
+        async for group in self.collection.aggregate(
+            [
+                {"$match": LATEST},
+                {"$sort": {"version_sort_key": -1}},
+                {"$group": {"_id": "$name", "ids": {"$push": "$id"}}},
+                {"$match": {"ids.1": {"$exists": True}}},
+            ],
+            allowDiskUse=True,
+        ):
+            retired.extend(group["ids"][1:])
+        if not retired:
+            return
+
+        logger.warning("Retiring %d versions marked latest next to a newer version", len(retired))
+        seq = await self._reserve_seqs(len(retired))
+        await self._bulk_write([
+            UpdateOne(
+                {"id": id, **LATEST},
+                {"$set": {"version_detail.is_latest": False, **self._change(seq + position)}},
+            )
+            for position, id in enumerate(retired)
+        ])
+        self._counts.clear()
+        await self._bump_generation()
+
+    async def import_seed(self, seed_file_path: str) -> None:
+        """Import initial data from a JSON array or NDJSON seed file"""
+        if self.collection is None:
+            raise InvalidInputError("Database not connected")
+
+        progress = SeedProgress(f"collection {self.collection.name}")
+        batch_number = 0
+
+        async for servers, errors in validated_seed_batches(
+            seed_file_path, self.import_batch_size, self.import_workers
+        ):
+            if not servers:
+                progress.add(errors)
                 continue
 
-        print("MongoDB database import completed successfully")
+            await self._keep_newer_latest(servers)
+
+            # Skip servers stored with the same content, so that re-imports
+            # don't show up in the change feed
+            documents = [self._to_document(server) for server in servers]
+            stored = {}
+            async for doc in self.collection.find(
+                {"id": {"$in": [server.id for server in servers]}},
+                {"_id": 0, "id": 1, "content_hash": 1, "version_detail.is_latest": 1},
+            ):
+                stored[doc["id"]] = (doc.get("content_hash"), doc.get("version_detail", {}).get("is_latest"))
+            changed = [
+                (server, document)
+                for server, document in zip(servers, documents)
+                if stored.get(server.id) != (document["content_hash"], server.version_detail.is_latest)
+            ]
+            skipped = len(servers) - len(changed)
+            if not changed:
+                progress.add(errors, unchanged=skipped)
+                continue
+
+            # Upsert the changed servers in one round-trip
+            seq = await self._reserve_seqs(len(changed))
+            requests = [
+                UpdateOne(
+                    {"id": server.id},
+                    {"$set": {**document, **self._change(seq + position)}},
+                    upsert=True,
+                )
+                for position, (server, document) in enumerate(changed)
+            ]
+            result, write_errors = await self._bulk_write(requests)
+            # Listings change with every committed batch, also mid-import
+            self._counts.clear()
+            await self._bump_generation()
+            for index, error in sorted(write_errors.items()):
+                server = changed[index][0]
+                errors.append(
+                    f"Error importing server {server.name} ({server.id}): {error.get('errmsg')}"
+                )
+            for error in result.get("writeConcernErrors", []):
+                errors.append(f"Write concern error in seed batch: {error.get('errmsg')}")
+
+            created = result.get("nUpserted", 0)
+            updated = result.get("nModified", 0)
+            unchanged = result.get("nMatched", 0) - updated + skipped
+            batch_number += 1
+            logger.info(
+                "Seed batch %d: %d created, %d updated, %d unchanged, %d errors",
+                batch_number,
+                created,
+                updated,
+                unchanged,
+                len(errors),
+            )
+
+            progress.add(errors, created=created, updated=updated, unchanged=unchanged)
+
+        progress.finish()
+
+    async def _keep_newer_latest(self, servers: List[ServerDetail]) -> None:
+        """
+        Clear the latest flag of seed servers that have a newer stored version
+
+        Re-importing the seed must not bring back a version that a later
+        publish retired.
+        """
+        latest = {}
+        async for doc in self.collection.find(
+            {**LATEST, "name": {"$in": list({server.name for server in servers})}},
+            {"_id": 0, "id": 1, "name": 1, "version_sort_key": 1},
+        ):
+            latest[doc["name"]] = doc
+
+        for server in servers:
+            stored = latest.get(server.name)
+            if (
+                server.version_detail.is_latest
+                and stored is not None
+                and stored["id"] != server.id
+                and stored.get("version_sort_key", "") > version_sort_key(server.version_detail.version)
+            ):
+                server.version_detail.is_latest = False
 
     async def close(self) -> None:
         """Close the database connection"""
@@ -0,0 +1,121 @@
+import logging
+import os
+from typing import BinaryIO, Iterable, List, Optional
+
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FILE = "snapshot.ndjson"
+LOG_FILE = "wal.ndjson"
+SEQ_FILE = "seq"
+
+
+class MemoryStore:
+    """
+    Append-only write-ahead log plus compacted snapshot for MemoryDB
+
+    Both files hold one JSON-encoded ServerDetail per line. Loading the
+    snapshot and then the log in order, with later records replacing
+    earlier ones with the same ID, rebuilds the stored records. Writing a
+    snapshot replaces the old one atomically and then empties the log.
+
+    The last change sequence number is saved with each snapshot, so that
+    it plus the number of logged records bounds every number handed out.
+    """
+
+    def __init__(self, data_dir: str):
+        self.data_dir = data_dir
+        self.snapshot_path = os.path.join(data_dir, SNAPSHOT_FILE)
+        self.log_path = os.path.join(data_dir, LOG_FILE)
+        self.seq_path = os.path.join(data_dir, SEQ_FILE)
+        self.log_records = 0
+        self.last_seq = 0
+        self._log: Optional[BinaryIO] = None
+
+    def open(self) -> List[bytes]:
+        """
+        Open the store and read back every persisted record
+
+        Returns:
+            Encoded records, snapshot first, then the log in write order
+        """
+        os.makedirs(self.data_dir, exist_ok=True)
+
+        if os.path.exists(self.seq_path):
+            with open(self.seq_path, "rb") as f:
+                try:
+                    self.last_seq = int(f.read())
+                except ValueError:
+                    logger.warning("Ignoring unreadable sequence number in %s", self.seq_path)
+
+        records: List[bytes] = []
+        if os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path, "rb") as f:
+                records.extend(line for line in f.read().split(b"\n") if line)
+
+        log_data = b""
+        if os.path.exists(self.log_path):
+            with open(self.log_path, "rb") as f:
+                log_data = f.read()
+
+        # Drop a record torn by a crash in the middle of an append
+        end = log_data.rfind(b"\n") + 1
+        if end < len(log_data):
+            logger.warning(
+                "Discarding %d bytes of incomplete record at end of %s",
+                len(log_data) - end,
+                self.log_path,
+            )
+            with open(self.log_path, "r+b") as f:
+                f.truncate(end)
+
+        log_records = [line for line in log_data[:end].split(b"\n") if line]
+        records.extend(log_records)
+        self.log_records = len(log_records)
+
+        self._log = open(self.log_path, "ab")
+        return records
+
+    def append(self, records: List[bytes]) -> None:
+        """Durably append encoded records to the log"""
+        if self._log is None:
+            raise RuntimeError("Store is not open")
+
+        self._log.write(b"".join(record + b"\n" for record in records))
+        self._log.flush()
+        os.fsync(self._log.fileno())
+        self.log_records += len(records)
+
+    def write_snapshot(self, records: Iterable[bytes], last_seq: int) -> None:
+        """Replace the snapshot with the given records and empty the log"""
+        if self._log is None:
+            raise RuntimeError("Store is not open")
+
+        # Saved first: a crash before the log is emptied only overestimates
+        self._replace(self.seq_path, [str(last_seq).encode()])
+        self.last_seq = last_seq
+
+        self._replace(self.snapshot_path, records)
+
+        # Everything in the log is now covered by the snapshot
+        self._log.truncate(0)
+        self._log.flush()
+        os.fsync(self._log.fileno())
+        self.log_records = 0
+
+    @staticmethod
+    def _replace(path: str, records: Iterable[bytes]) -> None:
+        """Atomically replace a file with the given lines"""
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            for record in records:
+                f.write(record + b"\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    def close(self) -> None:
+        """Close the log file"""
+        if self._log is not None:
+            self._log.close()
+            self._log = None
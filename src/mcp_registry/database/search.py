@@ -0,0 +1,157 @@
+import bisect
+import heapq
+import math
+import re
+from typing import Dict, List, Optional, Tuple
+
+from ..models import ServerDetail
+from .base import InvalidInputError
+
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+# Batches up to this size are inserted with bisect rather than merged
+SMALL_BATCH = 64
+
+# Score weight of a term by the field it appears in
+FIELD_WEIGHTS = {
+    "name": 3.0,
+    "packages.name": 2.0,
+    "description": 1.0,
+}
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Split text into lowercase alphanumeric terms"""
+    return _TOKEN.findall(text.lower()) if text else []
+
+
+def search_terms(entry: ServerDetail) -> Dict[str, float]:
+    """Get the weighted search terms of an entry"""
+    fields = [("name", entry.name), ("description", entry.description)]
+    fields.extend(("packages.name", package.name) for package in entry.packages or [])
+
+    terms: Dict[str, float] = {}
+    for field, text in fields:
+        for term in tokenize(text):
+            terms[term] = terms.get(term, 0.0) + FIELD_WEIGHTS[field]
+    return terms
+
+
+def parse_search_cursor(cursor: Optional[str]) -> int:
+    """
+    Parse a search cursor into a result offset
+
+    Search results are ordered by score rather than ID, so search
+    cursors are result offsets instead of IDs.
+
+    Raises:
+        InvalidInputError: If the cursor is not a non-negative integer
+    """
+    if not cursor:
+        return 0
+    if not cursor.isdigit():
+        raise InvalidInputError("Invalid cursor format")
+    return int(cursor)
+
+
+class SearchIndex:
+    """
+    Inverted index from search terms to weighted entry IDs
+
+    A query matches the entries containing all of its terms. Matches are
+    ranked by the sum of their term weights, each scaled by how rare the
+    term is, with ties broken by ID.
+    """
+
+    def __init__(self) -> None:
+        # term -> ID -> weight
+        self.postings: Dict[str, Dict[str, float]] = {}
+        # ID -> term -> weight, to remove entries
+        self.terms: Dict[str, Dict[str, float]] = {}
+
+    def add(self, server_id: str, terms: Dict[str, float]) -> None:
+        """Index an entry's terms, replacing any previous ones"""
+        self.remove(server_id)
+        self.terms[server_id] = terms
+        for term, weight in terms.items():
+            self.postings.setdefault(term, {})[server_id] = weight
+
+    def remove(self, server_id: str) -> None:
+        """Remove an entry, if indexed"""
+        terms = self.terms.pop(server_id, None)
+        if terms is None:
+            return
+        for term in terms:
+            posting = self.postings[term]
+            del posting[server_id]
+            if not posting:
+                del self.postings[term]
+
+    def search(self, query: str, offset: int, limit: int) -> Tuple[List[str], bool]:
+        """
+        Rank the entries matching a query
+
+        Returns:
+            Tuple of (IDs of the requested slice, whether more results follow)
+        """
+        postings = [self.postings.get(term) for term in set(tokenize(query))]
+        if not postings or not all(postings):
+            return [], False
+
+        # Walk the rarest term's postings and probe the others
+        postings.sort(key=len)
+        total = len(self.terms)
+        idfs = [math.log(1.0 + total / len(posting)) for posting in postings]
+
+        scored = []
+        for server_id, weight in postings[0].items():
+            score = weight * idfs[0]
+            for posting, idf in zip(postings[1:], idfs[1:]):
+                other = posting.get(server_id)
+                if other is None:
+                    break
+                score += other * idf
+            else:
+                scored.append((-score, server_id))
+
+        ranked = heapq.nsmallest(offset + limit + 1, scored)
+        return [server_id for _, server_id in ranked[offset:offset + limit]], len(ranked) > offset + limit
+
+
+class PrefixIndex:
+    """Sorted server names for prefix lookups with bisect"""
+
+    def __init__(self) -> None:
+        self.names: List[str] = []
+
+    def add(self, name: str) -> None:
+        """Insert a name"""
+        bisect.insort(self.names, name)
+
+    def add_many(self, names: List[str]) -> None:
+        """Insert a batch of names, merging large batches into a fresh list"""
+        if len(names) <= SMALL_BATCH:
+            for name in names:
+                self.add(name)
+        else:
+            merged = self.names + sorted(names)
+            merged.sort()
+            self.names = merged
+
+    def remove(self, name: str) -> None:
+        """Remove a name, if present"""
+        idx = bisect.bisect_left(self.names, name)
+        if idx < len(self.names) and self.names[idx] == name:
+            del self.names[idx]
+
+    def complete(self, prefix: str, limit: int) -> List[str]:
+        """Get up to limit names starting with prefix, in order"""
+        names = self.names
+        start = bisect.bisect_left(names, prefix)
+        matches = []
+        for name in names[start:start + limit]:
+            if not name.startswith(prefix):
+                break
+            matches.append(name)
+        return matches
@@ -0,0 +1,288 @@
+import asyncio
+import json
+import logging
+import multiprocessing
+import re
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Any, AsyncIterator, Deque, Dict, Iterator, List, Optional, TextIO, Tuple
+
+from ..models import ServerDetail
+from .base import InvalidInputError
+
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s*")
+_DELIMITERS = ",]} \t\r\n"
+
+
+class _ArrayReader:
+    """Incremental reader for the items of a top-level JSON array"""
+
+    def __init__(self, f: TextIO, chunk_size: int):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.data = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def fill(self) -> bool:
+        """Read another chunk, dropping consumed input; False at end of file"""
+        if self.eof:
+            return False
+        chunk = self.f.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.data = self.data[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character, or "" at end of file"""
+        while True:
+            self.pos = _WHITESPACE.match(self.data, self.pos).end()
+            if self.pos < len(self.data):
+                return self.data[self.pos]
+            if not self.fill():
+                return ""
+
+    def decode(self) -> Any:
+        """Decode the next JSON value, reading more input as needed"""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.data, self.pos)
+            except json.JSONDecodeError:
+                if self.fill():
+                    continue
+                raise
+            # A number may continue in the next chunk unless a delimiter follows it
+            if (
+                isinstance(value, (int, float))
+                and (end == len(self.data) or self.data[end] not in _DELIMITERS)
+                and self.fill()
+            ):
+                continue
+            self.pos = end
+            return value
+
+    def items(self) -> Iterator[Any]:
+        """Yield array items one at a time"""
+        if self.peek() != "[":
+            raise InvalidInputError("Seed data must be a list of servers")
+        self.pos += 1
+
+        if self.peek() == "]":
+            self.pos += 1
+        else:
+            while True:
+                yield self.decode()
+                separator = self.peek()
+                self.pos += 1
+                if separator == "]":
+                    break
+                if separator != ",":
+                    raise json.JSONDecodeError("Expected ',' or ']'", self.data, self.pos - 1)
+
+        if self.peek():
+            raise json.JSONDecodeError("Extra data", self.data, self.pos)
+
+
+def iter_seed_items(seed_file_path: str, chunk_size: int = 1 << 16) -> Iterator[Any]:
+    """
+    Yield the raw items of a seed file one at a time
+
+    Accepts either a JSON array of servers or NDJSON (one server per
+    line). Only one chunk and one item are held in memory at a time.
+    Array items are yielded decoded; NDJSON lines are yielded as-is and
+    decoded during validation.
+
+    Raises:
+        InvalidInputError: If the file is missing or is not valid JSON
+    """
+    try:
+        f = open(seed_file_path, "r", encoding="utf-8")
+    except FileNotFoundError:
+        raise InvalidInputError(f"Seed file not found: {seed_file_path}")
+
+    with f:
+        reader = _ArrayReader(f, chunk_size)
+        first = reader.peek()
+
+        if first == "[":
+            try:
+                yield from reader.items()
+            except json.JSONDecodeError as e:
+                raise InvalidInputError(f"Invalid JSON in seed file: {e}")
+            return
+
+        if first != "{":
+            raise InvalidInputError("Seed data must be a list of servers")
+
+        # NDJSON: one server object per line
+        f.seek(0)
+        for line in f:
+            line = line.strip()
+            if line:
+                yield line
+
+
+def iter_seed_batches(
+    seed_file_path: str, batch_size: int
+) -> Iterator[Tuple[int, List[Any]]]:
+    """
+    Yield raw seed items in batches
+
+    Returns:
+        Iterator of (index of the first item, items)
+    """
+    start = 0
+    batch: List[Any] = []
+    for item in iter_seed_items(seed_file_path):
+        batch.append(item)
+        if len(batch) >= batch_size:
+            yield start, batch
+            start += len(batch)
+            batch = []
+
+    if batch:
+        yield start, batch
+
+
+def validate_seed_batch(
+    start: int, items: List[Any]
+) -> Tuple[List[ServerDetail], List[str]]:
+    """
+    Validate a batch of raw seed items
+
+    Entries without an ID or name are skipped and entries without a
+    version get a default seed version. This runs in worker processes
+    for parallel imports, so it must stay a picklable module function.
+
+    Args:
+        start: Index of the first item in the seed file
+        items: Decoded seed items or undecoded JSON lines
+
+    Returns:
+        Tuple of (valid servers, messages for skipped or invalid items)
+    """
+    servers: List[ServerDetail] = []
+    errors: List[str] = []
+
+    for i, server_data in enumerate(items, start):
+        try:
+            if isinstance(server_data, str):
+                server = ServerDetail.model_validate_json(server_data)
+            else:
+                server = ServerDetail.model_validate(server_data)
+        except Exception as e:
+            errors.append(f"Error importing server {i + 1}: {e}")
+            continue
+
+        if not server.id or not server.name:
+            errors.append(f"Skipping server {i + 1}: ID or Name is empty")
+            continue
+
+        # Set default version if missing
+        if not server.version_detail.version:
+            server.version_detail.version = "0.0.1-seed"
+            server.version_detail.release_date = datetime.now().isoformat()
+            server.version_detail.is_latest = True
+
+        servers.append(server)
+
+    return servers, errors
+
+
+async def validated_seed_batches(
+    seed_file_path: str, batch_size: int, workers: int = 0
+) -> AsyncIterator[Tuple[List[ServerDetail], List[str]]]:
+    """
+    Read and validate a seed file batch by batch
+
+    With workers > 0, batches are validated in a process pool while the
+    file is still being read, with at most two batches per worker in
+    flight. The file is then read in a thread, since array items are
+    decoded while reading. Results are yielded in file order either way.
+
+    Args:
+        seed_file_path: Path to the seed file
+        batch_size: Number of items per batch
+        workers: Number of worker processes, 0 to validate inline
+
+    Returns:
+        Async iterator of (valid servers, messages for skipped or invalid items)
+    """
+    if workers <= 0:
+        for start, items in iter_seed_batches(seed_file_path, batch_size):
+            yield validate_seed_batch(start, items)
+        return
+
+    loop = asyncio.get_running_loop()
+    # Spawned workers don't inherit the event loop or driver threads
+    pool = ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    )
+    pending: Deque[asyncio.Future] = deque()
+    batches = iter_seed_batches(seed_file_path, batch_size)
+    try:
+        while True:
+            batch = await loop.run_in_executor(None, next, batches, None)
+            if batch is None:
+                break
+            start, items = batch
+            pending.append(loop.run_in_executor(pool, validate_seed_batch, start, items))
+            if len(pending) >= workers * 2:
+                yield await pending.popleft()
+
+        while pending:
+            yield await pending.popleft()
+    finally:
+        for future in pending:
+            future.cancel()
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+class SeedProgress:
+    """Throttled progress reporting for a seed import"""
+
+    def __init__(self, target: str, interval: float = 5.0):
+        self.target = target
+        self.interval = interval
+        self.counts: Dict[str, int] = {}
+        self._started = time.monotonic()
+        self._last_report = self._started
+
+    def add(self, errors: Optional[List[str]] = None, **counts: int) -> None:
+        """Record the outcome of a batch, reporting at most once per interval"""
+        for message in errors or []:
+            logger.warning(message)
+        if errors:
+            counts["errors"] = len(errors)
+
+        for key, value in counts.items():
+            self.counts[key] = self.counts.get(key, 0) + value
+
+        now = time.monotonic()
+        if now - self._last_report >= self.interval:
+            self._last_report = now
+            self._report("in progress")
+
+    def finish(self) -> None:
+        """Report the final counts"""
+        self._report("completed")
+
+    def _report(self, state: str) -> None:
+        summary = ", ".join(f"{value} {key}" for key, value in self.counts.items())
+        logger.info(
+            "Seed import into %s %s: %s (%.1fs)",
+            self.target,
+            state,
+            summary or "nothing imported",
+            time.monotonic() - self._started,
+        )
@@ -0,0 +1,41 @@
+from typing import Tuple
+
+
+VersionKey = Tuple[int, ...]
+
+
+def version_key(version: str) -> VersionKey:
+    """
+    Parse a semantic version string into a sortable key
+
+    Non-numeric parts count as 0 and trailing zeros are dropped, so keys
+    order the same way as compare_semantic_versions ("1.0" == "1.0.0").
+    """
+    parts = []
+    for part in version.split("."):
+        try:
+            parts.append(max(int(part), 0))
+        except ValueError:
+            parts.append(0)
+
+    while parts and parts[-1] == 0:
+        parts.pop()
+
+    return tuple(parts)
+
+
+# Digits per version part in a sort key string
+_SORT_KEY_WIDTH = 10
+
+
+def version_sort_key(version: str) -> str:
+    """
+    Encode a version as a string that sorts like version_key()
+
+    Each part is zero-padded to a fixed width, so plain string comparison
+    (as done by MongoDB) orders versions semantically.
+    """
+    limit = 10 ** _SORT_KEY_WIDTH - 1
+    return "".join(
+        str(min(part, limit)).zfill(_SORT_KEY_WIDTH) for part in version_key(version)
+    )
@@ -10,10 +10,11 @@ from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
 
 from .api import router
+from .api.compression import COMPRESSORS, CompressedBodyCache
 from .auth import AuthService
 from .auth.base import NoOpAuthService, SimpleTokenAuthService
 from .config import Settings, DatabaseType, get_settings
-from .database import Database, MemoryDB, MongoDB
+from .database import CachingDatabase, Database, MemoryDB, MongoDB
 from .service import RegistryService, RegistryServiceImpl
 
 
@@ -28,29 +29,53 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     
     # Initialize database
     database = None
+    seed_task = None
     try:
         if settings.database_type == DatabaseType.MEMORY:
-            database = MemoryDB()
+            database = MemoryDB(
+                import_batch_size=settings.seed_batch_size,
+                import_workers=settings.seed_import_workers,
+                json_cache=settings.memory_json_cache,
+                data_dir=settings.memory_data_dir,
+                snapshot_interval=settings.memory_snapshot_interval,
+                change_log_size=settings.memory_change_log_size,
+            )
+            await database.connect()
             print(f"Using in-memory database")
         elif settings.database_type == DatabaseType.MONGODB:
             database = MongoDB(
                 connection_uri=settings.database_url,
                 database_name=settings.database_name,
                 collection_name=settings.collection_name,
+                import_batch_size=settings.seed_batch_size,
+                import_workers=settings.seed_import_workers,
+                check_query_plans=settings.check_query_plans,
+                trusted_reads=settings.trusted_reads,
+                count_cache_ttl=settings.count_cache_ttl,
             )
             await database.connect()
             print(f"Connected to MongoDB: {settings.database_name}/{settings.collection_name}")
         else:
             raise ValueError(f"Unsupported database type: {settings.database_type}")
         
+        # Wrap the database in a read-through cache if requested
+        if settings.read_cache:
+            database = CachingDatabase(
+                database,
+                detail_bytes=settings.read_cache_detail_bytes,
+                list_bytes=settings.read_cache_list_bytes,
+                ttl=settings.read_cache_ttl,
+            )
+        
         # Import seed data if requested
         if settings.seed_import and settings.seed_file_path:
-            print("Importing seed data...")
-            try:
-                await database.import_seed(settings.seed_file_path)
-                print("Seed data import completed successfully")
-            except Exception as e:
-                print(f"Failed to import seed data: {e}")
+            if settings.seed_import_background:
+                # Serve requests while the import runs
+                seed_task = asyncio.create_task(
+                    import_seed_data(database, settings.seed_file_path)
+                )
+            else:
+                await import_seed_data(database, settings.seed_file_path)
         
         # Initialize services
         registry_service = RegistryServiceImpl(database)
@@ -71,16 +96,32 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         app_state["registry_service"] = registry_service
         app_state["auth_service"] = auth_service
         app_state["settings"] = settings
+        app_state["body_cache"] = (
+            CompressedBodyCache(settings.compression_cache_bytes)
+            if settings.response_compression
+            else None
+        )
         
         print(f"MCP Registry started successfully")
         print(f"- Database: {settings.database_type}")
         print(f"- Auth enabled: {settings.auth_enabled}")
+        if settings.response_compression:
+            print(f"- Compression: {', '.join(COMPRESSORS)}")
+        if settings.read_cache:
+            print(f"- Read cache: {settings.read_cache_ttl}s TTL")
         print(f"- Version: {settings.version}")
         
         yield
         
     finally:
         # Cleanup
+        if seed_task and not seed_task.done():
+            seed_task.cancel()
+            try:
+                await seed_task
+            except asyncio.CancelledError:
+                pass
+
         if database:
             try:
                 await database.close()
@@ -89,6 +130,19 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
                 print(f"Error closing database connection: {e}")
 
 
+async def import_seed_data(database: Database, seed_file_path: str) -> None:
+    """Import seed data, recording its status in the application state"""
+    print("Importing seed data...")
+    app_state["seed_import"] = "running"
+    try:
+        await database.import_seed(seed_file_path)
+        app_state["seed_import"] = "completed"
+        print("Seed data import completed successfully")
+    except Exception as e:
+        app_state["seed_import"] = "failed"
+        print(f"Failed to import seed data: {e}")
+
+
 # Dependency injection functions
 async def get_registry_service() -> RegistryService:
     """Get the registry service instance"""
@@ -1,9 +1,10 @@
 import asyncio
 from abc import ABC, abstractmethod
-from typing import List, Optional, Tuple
+from datetime import datetime
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 
 from ..database import Database
-from ..database.base import InvalidInputError
+from ..database.base import DatabaseError, InvalidInputError
 from ..models import Server, ServerDetail
 
 
@@ -14,7 +15,8 @@ class RegistryService(ABC):
     async def list(
         self, 
         cursor: Optional[str] = None, 
-        limit: int = 30
+        limit: int = 30,
+        filters: Optional[Dict[str, str]] = None
     ) -> Tuple[List[Server], Optional[str]]:
         """
         List servers with pagination
@@ -22,12 +24,26 @@ class RegistryService(ABC):
         Args:
             cursor: Pagination cursor
             limit: Maximum number of results
+            filters: Optional database filter keys and values
             
         Returns:
             Tuple of (servers, next_cursor)
         """
         pass
 
+    @abstractmethod
+    async def count(self, filters: Optional[Dict[str, str]] = None) -> int:
+        """
+        Count servers across pages
+        
+        Args:
+            filters: Optional database filter keys and values
+            
+        Returns:
+            Total number of matching servers
+        """
+        pass
+
     @abstractmethod
     async def get_by_id(self, id: str) -> ServerDetail:
         """
@@ -41,6 +57,159 @@ class RegistryService(ABC):
         """
         pass
 
+    @abstractmethod
+    async def list_json(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 30,
+        filters: Optional[Dict[str, str]] = None
+    ) -> Tuple[List[bytes], Optional[str]]:
+        """
+        List servers with pagination as JSON-encoded Server summaries
+        
+        Args:
+            cursor: Pagination cursor
+            limit: Maximum number of results
+            filters: Optional database filter keys and values
+            
+        Returns:
+            Tuple of (encoded servers, next_cursor)
+        """
+        pass
+
+    @abstractmethod
+    async def search_json(
+        self,
+        query: str,
+        cursor: Optional[str] = None,
+        limit: int = 30
+    ) -> Tuple[List[bytes], Optional[str]]:
+        """
+        Search servers, returning ranked JSON-encoded Server summaries
+        
+        Args:
+            query: Search terms
+            cursor: Pagination cursor
+            limit: Maximum number of results
+            
+        Returns:
+            Tuple of (encoded servers, next_cursor)
+        """
+        pass
+
+    @abstractmethod
+    async def suggest(self, prefix: str, limit: int = 10) -> List[Tuple[str, str]]:
+        """
+        Complete a server name prefix
+        
+        Args:
+            prefix: Start of the server name
+            limit: Maximum number of names
+            
+        Returns:
+            List of (name, ID of the latest version)
+        """
+        pass
+
+    @abstractmethod
+    async def get_json_by_id(self, id: str) -> bytes:
+        """
+        Get the JSON-encoded server details by ID
+        
+        Args:
+            id: Server ID
+            
+        Returns:
+            Encoded ServerDetail
+        """
+        pass
+
+    @abstractmethod
+    async def etag(self, id: str) -> str:
+        """
+        Get the ETag of a server's details
+        
+        Args:
+            id: Server ID
+            
+        Returns:
+            Quoted strong ETag
+        """
+        pass
+
+    @abstractmethod
+    async def get_json_with_etag(self, id: str) -> Tuple[bytes, str]:
+        """
+        Get the JSON-encoded server details by ID with their ETag
+        
+        Args:
+            id: Server ID
+            
+        Returns:
+            Tuple of (encoded ServerDetail, quoted strong ETag)
+        """
+        pass
+
+    @abstractmethod
+    def export_json(self) -> AsyncIterator[bytes]:
+        """
+        Stream the latest version of every server as NDJSON
+        
+        Returns:
+            Async iterator of chunks of newline-terminated ServerDetail JSON
+        """
+        pass
+
+    @abstractmethod
+    async def changes(
+        self, since: int, limit: int
+    ) -> Tuple[List[Tuple[int, ServerDetail]], int, bool]:
+        """
+        Get the records written after a change sequence number
+        
+        Args:
+            since: Sequence number of the last change already applied
+            limit: Maximum number of changes to return
+            
+        Returns:
+            Tuple of (list of (sequence number, record) in order, sequence
+            number to resume from, whether more changes follow)
+        """
+        pass
+
+    @abstractmethod
+    async def change_seq(self) -> int:
+        """
+        Get the sequence number to follow changes from
+        
+        Returns:
+            Sequence number covering every record visible now
+        """
+        pass
+
+    @abstractmethod
+    async def generation(self) -> Tuple[int, datetime]:
+        """
+        Get the registry generation, which changes whenever any listing changes
+        
+        Returns:
+            Tuple of (generation, time of the last change)
+        """
+        pass
+
+    @abstractmethod
+    async def get_many_json(self, ids: List[str]) -> Dict[str, bytes]:
+        """
+        Get the JSON-encoded details of several servers by ID
+        
+        Args:
+            ids: Server IDs
+            
+        Returns:
+            Encoded ServerDetails by ID, without the IDs that don't exist
+        """
+        pass
+
     @abstractmethod
     async def publish(self, server_detail: ServerDetail) -> None:
         """
@@ -51,6 +220,19 @@ class RegistryService(ABC):
         """
         pass
 
+    @abstractmethod
+    async def publish_many(self, servers: List[ServerDetail]) -> List[Optional[DatabaseError]]:
+        """
+        Publish several servers together
+        
+        Args:
+            servers: Server details to publish
+            
+        Returns:
+            None for each published server, or the error that rejected it
+        """
+        pass
+
 
 class RegistryServiceImpl(RegistryService):
     """Implementation of RegistryService using a Database"""
@@ -61,7 +243,8 @@ class RegistryServiceImpl(RegistryService):
     async def list(
         self, 
         cursor: Optional[str] = None, 
-        limit: int = 30
+        limit: int = 30,
+        filters: Optional[Dict[str, str]] = None
     ) -> Tuple[List[Server], Optional[str]]:
         """List servers with pagination"""
         
@@ -72,13 +255,25 @@ class RegistryServiceImpl(RegistryService):
         # Add timeout to database operation
         try:
             servers, next_cursor = await asyncio.wait_for(
-                self.db.list(cursor=cursor, limit=limit),
+                self.db.list(filter_params=filters, cursor=cursor, limit=limit),
                 timeout=5.0
             )
             return servers, next_cursor
         except asyncio.TimeoutError:
             raise Exception("Database operation timed out")
 
+    async def count(self, filters: Optional[Dict[str, str]] = None) -> int:
+        """Count servers across pages"""
+        
+        # Add timeout to database operation
+        try:
+            return await asyncio.wait_for(
+                self.db.count(filters),
+                timeout=5.0
+            )
+        except asyncio.TimeoutError:
+            raise Exception("Database operation timed out")
+
     async def get_by_id(self, id: str) -> ServerDetail:
         """Get server details by ID"""
         
@@ -92,6 +287,156 @@ class RegistryServiceImpl(RegistryService):
         except asyncio.TimeoutError:
             raise Exception("Database operation timed out")
 
+    async def list_json(
+        self, 
+        cursor: Optional[str] = None, 
+        limit: int = 30,
+        filters: Optional[Dict[str, str]] = None
+    ) -> Tuple[List[bytes], Optional[str]]:
+        """List servers with pagination as JSON-encoded Server summaries"""
+        
+        # Set default limit if not provided or invalid
+        if limit <= 0:
+            limit = 30
+        
+        # Add timeout to database operation
+        try:
+            return await asyncio.wait_for(
+                self.db.list_json(filter_params=filters, cursor=cursor, limit=limit),
+                timeout=5.0
+            )
+        except asyncio.TimeoutError:
+            raise Exception("Database operation timed out")
+
+    async def search_json(
+        self,
+        query: str,
+        cursor: Optional[str] = None,
+        limit: int = 30
+    ) -> Tuple[List[bytes], Optional[str]]:
+        """Search servers, returning ranked JSON-encoded Server summaries"""
+        
+        # Set default limit if not provided or invalid
+        if limit <= 0:
+            limit = 30
+        
+        # Add timeout to database operation
+        try:
+            return await asyncio.wait_for(
+                self.db.search_json(query, cursor=cursor, limit=limit),
+                timeout=5.0
+            )
+        except asyncio.TimeoutError:
+            raise Exception("Database operation timed out")
+
+    async def suggest(self, prefix: str, limit: int = 10) -> List[Tuple[str, str]]:
+        """Complete a server name prefix"""
+        
+        # Set default limit if not provided or invalid
+        if limit <= 0:
+            limit = 10
+        
+        # Add timeout to database operation
+        try:
+            return await asyncio.wait_for(
+                self.db.suggest(prefix, limit=limit),
+                timeout=5.0
+            )
+        except asyncio.TimeoutError:
+            raise Exception("Database operation timed out")
+
+    async def get_json_by_id(self, id: str) -> bytes:
+        """Get the JSON-encoded server details by ID"""
+        
+        # Add timeout to database operation
+        try:
+            return await asyncio.wait_for(
+                self.db.get_json_by_id(id),
+                timeout=5.0
+            )
+        except asyncio.TimeoutError:
+            raise Exception("Database operation timed out")
+
+    async def etag(self, id: str) -> str:
+        """Get the ETag of a server's details"""
+        
+        # Add timeout to database operation
+        try:
+            return await asyncio.wait_for(
+                self.db.etag(id),
+                timeout=5.0
+            )
+        except asyncio.TimeoutError:
+            raise Exception("Database operation timed out")
+
+    async def get_json_with_etag(self, id: str) -> Tuple[bytes, str]:
+        """Get the JSON-encoded server details by ID with their ETag"""
+        
+        # Add timeout to database operation
+        try:
+            return await asyncio.wait_for(
+                self.db.get_json_with_etag(id),
+                timeout=5.0
+            )
+        except asyncio.TimeoutError:
+            raise Exception("Database operation timed out")
+
+    def export_json(self) -> AsyncIterator[bytes]:
+        """Stream the latest version of every server as NDJSON"""
+        
+        # No overall timeout: an export runs as long as the client reads
+        return self.db.export_json()
+
+    async def changes(
+        self, since: int, limit: int
+    ) -> Tuple[List[Tuple[int, ServerDetail]], int, bool]:
+        """Get the records written after a change sequence number"""
+        
+        # Add timeout to database operation
+        try:
+            return await asyncio.wait_for(
+                self.db.changes(since, limit),
+                timeout=5.0
+            )
+        except asyncio.TimeoutError:
+            raise Exception("Database operation timed out")
+
+    async def change_seq(self) -> int:
+        """Get the sequence number to follow changes from"""
+        
+        # Add timeout to database operation
+        try:
+            return await asyncio.wait_for(
+                self.db.change_seq(),
+                timeout=5.0
+            )
+        except asyncio.TimeoutError:
+            raise Exception("Database operation timed out")
+
+    async def generation(self) -> Tuple[int, datetime]:
+        """Get the registry generation"""
+        
+        # Add timeout to database operation
+        try:
+            return await asyncio.wait_for(
+                self.db.generation(),
+                timeout=5.0
+            )
+        except asyncio.TimeoutError:
+            raise Exception("Database operation timed out")
+
+    async def get_many_json(self, ids: List[str]) -> Dict[str, bytes]:
+        """Get the JSON-encoded details of several servers by ID"""
+        
+        # Add timeout to database operation
+        try:
+            return await asyncio.wait_for(
+                self.db.get_many_json(ids),
+                timeout=5.0
+            )
+        except asyncio.TimeoutError:
+            raise Exception("Database operation timed out")
+
     async def publish(self, server_detail: ServerDetail) -> None:
         """Publish a new server"""
         
@@ -104,5 +449,20 @@ class RegistryServiceImpl(RegistryService):
                 self.db.publish(server_detail),
                 timeout=5.0
             )
+        except asyncio.TimeoutError:
+            raise Exception("Database operation timed out")
+
+    async def publish_many(self, servers: List[ServerDetail]) -> List[Optional[DatabaseError]]:
+        """Publish several servers together"""
+        
+        if any(server_detail is None for server_detail in servers):
+            raise InvalidInputError("Server detail cannot be None")
+        
+        # Add timeout to database operation
+        try:
+            return await asyncio.wait_for(
+                self.db.publish_many(servers),
+                timeout=5.0
+            )
         except asyncio.TimeoutError:
             raise Exception("Database operation timed out")
\ No newline at end of file
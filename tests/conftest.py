@@ -0,0 +1,19 @@
+import pytest
+
+from mcp_registry.models import ServerDetail
+
+
+@pytest.fixture
+def make_server():
+    """Factory for unpublished servers with a given name and version"""
+
+    def make(name: str, version: str, repo_url: str = "https://github.com/example/server") -> ServerDetail:
+        return ServerDetail.model_validate({
+            "id": "",
+            "name": name,
+            "description": "Example server",
+            "repository": {"url": repo_url, "source": "github", "id": "1"},
+            "version_detail": {"version": version, "release_date": "", "is_latest": False},
+        })
+
+    return make
@@ -0,0 +1,45 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from mcp_registry.main import app_state, create_app
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setenv("MCP_REGISTRY_DATABASE_TYPE", "memory")
+    monkeypatch.setenv("MCP_REGISTRY_SEED_IMPORT", "false")
+    with TestClient(create_app()) as client:
+        yield client
+
+
+@pytest.fixture
+def publish(client, make_server):
+    """Publish a server through the registry service, returning its ID"""
+
+    def publish(name: str, version: str) -> str:
+        server = make_server(name, version)
+        client.portal.call(app_state["registry_service"].publish, server)
+        return server.id
+
+    return publish
+
+
+def test_batch_get_reports_malformed_ids_as_not_found(client, publish):
+    server_id = publish("io.example/server", "1.0.0")
+    missing_id = "00000000-0000-4000-8000-000000000000"
+
+    response = client.post(
+        "/v0/servers:batchGet", json={"ids": [server_id, "not-a-uuid", missing_id, server_id]}
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [server["id"] for server in body["servers"]] == [server_id]
+    assert body["not_found"] == ["not-a-uuid", missing_id]
+
+
+def test_batch_get_with_only_malformed_ids(client):
+    response = client.post("/v0/servers:batchGet", json={"ids": ["x"]})
+
+    assert response.status_code == 200
+    assert response.json() == {"servers": [], "not_found": ["x"]}
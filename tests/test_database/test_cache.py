@@ -0,0 +1,68 @@
+import asyncio
+import json
+
+from mcp_registry.database import CachingDatabase, MemoryDB
+
+
+async def test_publish_invalidates_retired_latest_detail(make_server):
+    db = CachingDatabase(MemoryDB())
+    # Several versions, so the retired latest is not the first by ID
+    for version in ("1.0.0", "1.1.0", "1.2.0"):
+        await db.publish(make_server("io.example/server", version))
+
+    latest = (await db.latest_versions(["io.example/server"]))["io.example/server"]
+    data, etag = await db.get_json_with_etag(latest.id)
+    assert json.loads(data)["version_detail"]["is_latest"] is True
+
+    await db.publish(make_server("io.example/server", "2.0.0"))
+
+    data, new_etag = await db.get_json_with_etag(latest.id)
+    assert json.loads(data)["version_detail"]["is_latest"] is False
+    assert new_etag != etag
+    assert await db.etag(latest.id) == new_etag
+
+
+async def test_publish_many_invalidates_pages_and_counts(make_server):
+    db = CachingDatabase(MemoryDB())
+    await db.publish(make_server("io.example/a", "1.0.0", "https://github.com/example/a"))
+
+    filters = {"repoUrl": "https://github.com/example/b"}
+    assert await db.count(filters) == 0
+    assert (await db.list_json(filters))[0] == []
+
+    # The retired version moves to another repository filter
+    results = await db.publish_many([
+        make_server("io.example/a", "2.0.0", "https://github.com/example/b"),
+        make_server("io.example/c", "1.0.0", "https://github.com/example/b"),
+    ])
+    assert results == [None, None]
+
+    assert await db.count(filters) == 2
+    servers, _ = await db.list_json(filters)
+    assert len(servers) == 2
+    assert db.stats()["list"]["hits"] == 0
+
+
+async def test_cached_reads_are_counted(make_server):
+    db = CachingDatabase(MemoryDB())
+    server = make_server("io.example/server", "1.0.0")
+    await db.publish(server)
+
+    await db.get_json_by_id(server.id)
+    await db.get_json_by_id(server.id)
+    stats = db.stats()["detail"]
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+
+
+async def test_pages_are_not_served_under_a_newer_generation(make_server):
+    db = CachingDatabase(MemoryDB())
+    await db.publish(make_server("io.example/a", "1.0.0"))
+    generation, _ = await db.generation()
+    assert len((await db.list_json())[0]) == 1
+
+    # Catch the backend generation moving before the publish returns
+    task = asyncio.create_task(db.publish(make_server("io.example/b", "1.0.0")))
+    while (await db.generation())[0] == generation:
+        await asyncio.sleep(0)
+    assert len((await db.list_json())[0]) == 2
+    await task
@@ -0,0 +1,72 @@
+import pytest
+
+from mcp_registry.database import MemoryDB
+from mcp_registry.database.base import ChangesExpiredError
+from mcp_registry.database import memory
+
+
+async def test_changes_before_start_are_expired():
+    db = MemoryDB()
+    start = await db.change_seq()
+
+    with pytest.raises(ChangesExpiredError):
+        await db.changes(start - 5, 10)
+
+    assert await db.changes(start, 10) == ([], start, False)
+
+
+async def test_changes_follow_publishes_in_order(make_server):
+    db = MemoryDB(change_log_size=3)
+    start = await db.change_seq()
+    await db.publish(make_server("io.example/server", "1.0.0"))
+    await db.publish(make_server("io.example/server", "2.0.0"))
+
+    # The second publish rewrote the first version as not latest
+    changes, next_since, has_more = await db.changes(start, 10)
+    assert [seq for seq, _ in changes] == [start + 1, start + 2, start + 3]
+    assert [server.version_detail.is_latest for _, server in changes] == [True, False, True]
+    assert (next_since, has_more) == (start + 3, False)
+    assert (await db.generation())[0] == next_since
+
+    changes, next_since, has_more = await db.changes(start, 1)
+    assert [seq for seq, _ in changes] == [start + 1]
+    assert (next_since, has_more) == (start + 1, True)
+
+    # The oldest change is overwritten once the log is full
+    await db.publish(make_server("io.example/other", "1.0.0"))
+    with pytest.raises(ChangesExpiredError):
+        await db.changes(start, 10)
+    changes, _, _ = await db.changes(start + 1, 10)
+    assert [seq for seq, _ in changes] == [start + 2, start + 3, start + 4]
+
+
+async def test_sequence_resumes_after_restart(tmp_path, monkeypatch, make_server):
+    # A clock far behind the numbers already handed out
+    monkeypatch.setattr(memory.time, "time_ns", lambda: 1_000_000)
+
+    db = MemoryDB(data_dir=str(tmp_path))
+    await db.connect()
+    for version in ("1.0.0", "1.1.0", "1.2.0"):
+        await db.publish(make_server("io.example/server", version))
+    last_seq = await db.change_seq()
+    await db.close()
+
+    db = MemoryDB(data_dir=str(tmp_path))
+    await db.connect()
+    assert await db.change_seq() >= last_seq
+    await db.publish(make_server("io.example/server", "2.0.0"))
+    assert await db.change_seq() > last_seq
+    await db.close()
+
+    # Without a clean shutdown the logged records still bound the sequence
+    db = MemoryDB(data_dir=str(tmp_path), snapshot_interval=100)
+    await db.connect()
+    await db.publish(make_server("io.example/server", "3.0.0"))
+    last_seq = await db.change_seq()
+    # Release the log without compacting it
+    db._persistence.close()
+
+    db = MemoryDB(data_dir=str(tmp_path))
+    await db.connect()
+    assert await db.change_seq() >= last_seq
+    await db.close()
@@ -0,0 +1,91 @@
+import asyncio
+import time
+
+import pytest
+
+from mcp_registry.database import MemoryDB
+
+
+async def test_timed_out_publish_is_still_applied(tmp_path, make_server):
+    db = MemoryDB(data_dir=str(tmp_path))
+    await db.connect()
+
+    append = db._persistence.append
+
+    def slow_append(records):
+        time.sleep(0.2)
+        append(records)
+
+    db._persistence.append = slow_append
+
+    server = make_server("io.example/server", "1.0.0")
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(db.publish(server), timeout=0.05)
+
+    # The logged record is applied even though the caller gave up
+    async with db._write_lock:
+        assert (await db.get_by_id(server.id)).version_detail.version == "1.0.0"
+    await db.close()
+
+
+async def test_compaction_runs_outside_publish(tmp_path, make_server):
+    db = MemoryDB(data_dir=str(tmp_path), snapshot_interval=2)
+    await db.connect()
+
+    await db.publish(make_server("io.example/server", "1.0.0"))
+    await db.publish(make_server("io.example/server", "2.0.0"))
+    assert db._compaction is not None
+    await db._compaction
+    assert db._persistence.log_records == 0
+    await db.close()
+
+    db = MemoryDB(data_dir=str(tmp_path))
+    await db.connect()
+    assert await db.count() == 2
+    await db.close()
+
+
+async def test_seed_reimport_keeps_newer_published_version_latest(tmp_path, make_server):
+    seed_server = make_server("io.example/seeded", "0.0.1-seed")
+    seed_server.id = "2b7f8f0a-0e44-4a3e-9d4c-6c1f0e0a1b2c"
+    seed_server.version_detail.is_latest = True
+    seed_path = tmp_path / "seed.json"
+    seed_path.write_text("[" + seed_server.model_dump_json() + "]")
+    data_dir = str(tmp_path / "data")
+
+    db = MemoryDB(data_dir=data_dir)
+    await db.connect()
+    await db.import_seed(str(seed_path))
+    await db.publish(make_server("io.example/seeded", "99.0.0"))
+    await db.close()
+
+    # Startup imports the seed again over the persisted records
+    db = MemoryDB(data_dir=data_dir)
+    await db.connect()
+    await db.import_seed(str(seed_path))
+
+    servers, _ = await db.list({"name": "io.example/seeded"})
+    latest = {server.version_detail.version: server.version_detail.is_latest for server in servers}
+    assert latest == {"0.0.1-seed": False, "99.0.0": True}
+    await db.close()
+
+
+async def test_publish_runs_between_seed_batches(tmp_path, make_server):
+    seed_servers = []
+    for i in range(100):
+        server = make_server(f"io.example/seeded-{i}", "1.0.0")
+        server.id = f"00000000-0000-4000-8000-{i:012d}"
+        server.version_detail.is_latest = True
+        seed_servers.append(server.model_dump_json())
+    seed_path = tmp_path / "seed.json"
+    seed_path.write_text("[" + ",".join(seed_servers) + "]")
+
+    db = MemoryDB(import_batch_size=10)
+    task = asyncio.create_task(db.import_seed(str(seed_path)))
+    while await db.count() == 0:
+        await asyncio.sleep(0)
+
+    await db.publish(make_server("io.example/server", "1.0.0"))
+    assert not task.done()
+    await task
+    assert await db.count() == 101
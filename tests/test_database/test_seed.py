@@ -0,0 +1,63 @@
+import json
+
+import pytest
+
+from mcp_registry.database.base import InvalidInputError
+from mcp_registry.database.seed import iter_seed_items
+
+
+ITEMS = [
+    {"id": "1", "name": "io.example/a", "stars": 12345, "score": -0.25, "tags": ["x", "y"]},
+    {"id": "2", "name": "io.example/b", "archived": False, "license": None, "ratio": 1e10},
+    123456789,
+    True,
+    "text with , and ] inside",
+]
+
+
+def write(tmp_path, text: str) -> str:
+    path = tmp_path / "seed.json"
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 7, 9, 1 << 16])
+def test_array_items_across_chunk_boundaries(tmp_path, chunk_size):
+    for text in (json.dumps(ITEMS), json.dumps(ITEMS, indent=2)):
+        assert list(iter_seed_items(write(tmp_path, text), chunk_size)) == ITEMS
+
+
+@pytest.mark.parametrize("chunk_size", [1, 4])
+def test_empty_array(tmp_path, chunk_size):
+    assert list(iter_seed_items(write(tmp_path, "  [ \n ]  \n"), chunk_size)) == []
+
+
+def test_ndjson_lines_are_yielded_undecoded(tmp_path):
+    lines = [json.dumps(item) for item in ITEMS[:2]]
+    path = write(tmp_path, "\n".join(lines) + "\n\n")
+
+    assert list(iter_seed_items(path, 3)) == lines
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "   \n",
+        "5",
+        "[1, 2] x",
+        "[1, 2][3]",
+        "[1, 2,]",
+        "[1 2]",
+        "[1, 2",
+        '[{"id": ]',
+    ],
+)
+def test_invalid_files_are_rejected(tmp_path, text):
+    with pytest.raises(InvalidInputError):
+        list(iter_seed_items(write(tmp_path, text), 2))
+
+
+def test_missing_file(tmp_path):
+    with pytest.raises(InvalidInputError, match="not found"):
+        list(iter_seed_items(str(tmp_path / "missing.json")))